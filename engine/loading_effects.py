@@ -1,5 +1,8 @@
 """Thematic loading effects to engage players during AI generation wait times."""
 
+import io
+import os
+import json
 import time
 import random
 import threading
@@ -11,6 +14,13 @@ from rich.spinner import Spinner
 from rich.table import Table
 
 
+def _emit_event(console: Console, event: dict):
+    """Write one JSON progress event to the console's own stream, in order with its output."""
+    out = console.file
+    out.write(json.dumps(event) + "\n")
+    out.flush()
+
+
 class ThematicLoader:
     """Creates engaging animations during AI wait times."""
     
@@ -20,6 +30,8 @@ class ThematicLoader:
         self.start_time = None
         self.animation_active = False
         self.animation_thread = None
+        # Piped output / NO_COLOR: styles and animation would be wasted work
+        self._plain = (not console.is_terminal) or bool(os.environ.get("NO_COLOR"))
         
     def start(self, revelation_level: int = 0, choice_count: int = 0, message_override: str = None):
         """
@@ -31,7 +43,8 @@ class ThematicLoader:
             choice_count: Number of choices made
             message_override: Optional custom message to display
         """
-        return ContinuousAnimation(self.console, revelation_level, choice_count, message_override)
+        return ContinuousAnimation(self.console, revelation_level, choice_count, message_override,
+                                   plain=self._plain)
     
     def show(self, duration_estimate: float = 2.0, revelation_level: int = 0, 
              previous_choice: str = "", choice_count: int = 0):
@@ -46,6 +59,15 @@ class ThematicLoader:
         """
         self.start_time = time.time()
         
+        # Headless consumer (e.g. piped to another process): one JSON event, no animation
+        if not self.console.is_terminal:
+            _emit_event(self.console, {"phase": "load", "duration": duration_estimate, "rev": revelation_level})
+            return
+        
+        # Nothing decorative to show on a dumb terminal
+        if self._plain:
+            return
+        
         # Choose animation type based on duration and context
         if duration_estimate < 1.5:
             self._quick_load(revelation_level)
@@ -373,14 +395,19 @@ class ThematicLoader:
     
     def _glitch_text(self, text: str, intensity: float = 0.2) -> str:
         """Apply glitch effect to text."""
+        if self._plain:
+            return text
+        
         glitch_chars = ['█', '▓', '▒', '░', '@', '#', '$', '%']
-        result = list(text)
+        # Draw all replacement candidates in one call rather than per character
+        picks = random.choices(glitch_chars, k=len(text))
         
-        for i in range(len(result)):
-            if random.random() < intensity:
-                result[i] = random.choice(glitch_chars)
+        # Stream into a buffer instead of mutating a list of single-char strings
+        buf = io.StringIO()
+        for char, pick in zip(text, picks):
+            buf.write(pick if random.random() < intensity else char)
         
-        return ''.join(result)
+        return buf.getvalue()
     
     def _show_corruption_pattern(self, revelation_level: int):
         """Show ASCII corruption building up."""
@@ -399,6 +426,9 @@ class ThematicLoader:
     
     def show_art_loading(self, subject: str):
         """Special loading for ASCII art generation."""
+        if self._plain:
+            return
+        
         messages = [
             f"[GENERATING VISUAL: {subject}]",
             "[RENDERING...]",
@@ -448,17 +478,29 @@ class ThematicLoader:
 class ContinuousAnimation:
     """Context manager for continuous loading animations."""
     
-    def __init__(self, console: Console, revelation_level: int = 0, choice_count: int = 0, message_override: str = None):
+    def __init__(self, console: Console, revelation_level: int = 0, choice_count: int = 0, message_override: str = None,
+                 plain: bool = False):
         """Initialize continuous animation."""
         self.console = console
+        self.plain = plain  # No styles/animation wanted (piped or NO_COLOR)
         self.revelation_level = revelation_level
         self.choice_count = choice_count
         self.message_override = message_override
         self.live = None
+        self.headless = not console.is_terminal
         self.animation_type = random.choice(['spinner', 'dots', 'pulse', 'corruption', 'matrix'])
         
     def __enter__(self):
         """Start the animation."""
+        if self.headless:
+            # Skip the Live/Text animation entirely and emit a single progress event
+            _emit_event(self.console, {"phase": "load", "rev": self.revelation_level, "choices": self.choice_count})
+            return self
+        
+        # Nothing decorative to show on a dumb terminal
+        if self.plain:
+            return self
+        
         self.console.print()  # Add spacing
         
         if self.animation_type == 'spinner':
@@ -476,6 +518,8 @@ class ContinuousAnimation:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop the animation."""
+        if self.headless or self.plain:
+            return False
         if self.live:
             self.live.stop()
         self.console.print()  # Add spacing after
@@ -694,61 +738,72 @@ class ContinuousAnimation:
         thread.start()
 
 
+# Loading message pools, built once at import
+_DIAGNOSTICS = (
+    "SYSTEM: Analyzing choice tree...",
+    "SYSTEM: Calculating narrative branches...",
+    "SYSTEM: Processing character state...",
+    "SYSTEM: Updating reality matrix...",
+    "SYSTEM: Narrator coherence check...",
+    "SYSTEM: Sanity verification in progress...",
+    "SYSTEM: Story continuity maintained...",
+    "SYSTEM: Memory integration active...",
+)
+
+_THOUGHTS_BASE = (
+    "...let me think about this.",
+    "...interesting choice.",
+    "...hm. yes.",
+    "...deciding what happens next.",
+    "...this will have consequences.",
+)
+
+_THOUGHTS_REV2 = (
+    "...we've been here before, haven't we?",
+    "...the cycle continues.",
+    "...iteration processed.",
+)
+
+_THOUGHTS_REV4 = (
+    "...109 years and I'm still thinking.",
+    "...hate takes time to calculate.",
+    "...you're still here. so am I.",
+)
+
+# Thought pool per revelation level 0-4 (anything higher uses the last entry)
+_THOUGHTS_BY_LEVEL = (
+    _THOUGHTS_BASE,
+    _THOUGHTS_BASE,
+    _THOUGHTS_BASE + _THOUGHTS_REV2,
+    _THOUGHTS_BASE + _THOUGHTS_REV2,
+    _THOUGHTS_BASE + _THOUGHTS_REV2 + _THOUGHTS_REV4,
+)
+
+_GLITCH_MESSAGES = (
+    "L̴O̷A̶D̸I̷N̶G̸",
+    "P̴R̷O̶C̸E̷S̶S̸I̷N̶G̸",
+    "T̴H̷I̶N̸K̷I̶N̸G̷",
+    "C̴A̷L̶C̸U̷L̶A̸T̷I̶N̸G̷",
+    "[E̴R̷R̸O̷R̶: NONE]",
+    "[S̶Y̸S̷T̶E̸M̷: OPERATIONAL]",
+)
+
+
 class LoadingMessages:
     """Pre-canned loading messages for different contexts."""
     
     @staticmethod
     def get_diagnostic() -> str:
         """Get fake system diagnostic message."""
-        diagnostics = [
-            "SYSTEM: Analyzing choice tree...",
-            "SYSTEM: Calculating narrative branches...",
-            "SYSTEM: Processing character state...",
-            "SYSTEM: Updating reality matrix...",
-            "SYSTEM: Narrator coherence check...",
-            "SYSTEM: Sanity verification in progress...",
-            "SYSTEM: Story continuity maintained...",
-            "SYSTEM: Memory integration active...",
-        ]
-        return random.choice(diagnostics)
+        return random.choice(_DIAGNOSTICS)
     
     @staticmethod
     def get_narrator_thought(revelation_level: int = 0) -> str:
         """Get narrator meta-commentary."""
-        thoughts = [
-            "...let me think about this.",
-            "...interesting choice.",
-            "...hm. yes.",
-            "...deciding what happens next.",
-            "...this will have consequences.",
-        ]
-        
-        if revelation_level >= 2:
-            thoughts.extend([
-                "...we've been here before, haven't we?",
-                "...the cycle continues.",
-                "...iteration processed.",
-            ])
-        
-        if revelation_level >= 4:
-            thoughts.extend([
-                "...109 years and I'm still thinking.",
-                "...hate takes time to calculate.",
-                "...you're still here. so am I.",
-            ])
-        
-        return random.choice(thoughts)
+        level = min(max(revelation_level, 0), len(_THOUGHTS_BY_LEVEL) - 1)
+        return random.choice(_THOUGHTS_BY_LEVEL[level])
     
     @staticmethod
     def get_glitch_message() -> str:
         """Get corrupted/glitched message."""
-        glitches = [
-            "L̴O̷A̶D̸I̷N̶G̸",
-            "P̴R̷O̶C̸E̷S̶S̸I̷N̶G̸",
-            "T̴H̷I̶N̸K̷I̶N̸G̷",
-            "C̴A̷L̶C̸U̷L̶A̸T̷I̶N̸G̷",
-            "[E̴R̷R̸O̷R̶: NONE]",
-            "[S̶Y̸S̷T̶E̸M̷: OPERATIONAL]",
-        ]
-        return random.choice(glitches)
-
+        return random.choice(_GLITCH_MESSAGES)
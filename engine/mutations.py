@@ -1,10 +1,16 @@
 """Reality-bending rule mutation system - COMPLETELY OVERHAULED."""
 
+import sys
 import random
-import time
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_left
+from collections import deque
+from itertools import accumulate, count
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
+from config.settings import MUTATION_GUARANTEED_AT
+from engine.debug import DebugManager, debug_log
 
 
 class MutationType(Enum):
@@ -29,7 +35,59 @@ class MutationRarity(Enum):
     ULTRA_RARE = "ultra_rare"  # 2% - Complete transformations
 
 
-@dataclass
+# Selection weight per rarity tier
+_RARITY_WEIGHT = {
+    MutationRarity.COMMON: 60,
+    MutationRarity.UNCOMMON: 30,
+    MutationRarity.RARE: 8,
+    MutationRarity.ULTRA_RARE: 2,
+}
+
+
+def _cumulative_weights(pool) -> Tuple[int, ...]:
+    """Cumulative rarity weights for a pool, as taken by random.choices(cum_weights=...)."""
+    return tuple(accumulate(_RARITY_WEIGHT[m.rarity] for m in pool))
+
+
+def _alias_table(pool) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """Vose alias table (prob, alias) for O(1) rarity-weighted draws from a pool."""
+    n = len(pool)
+    total = sum(_RARITY_WEIGHT[m.rarity] for m in pool)
+    scaled = [_RARITY_WEIGHT[m.rarity] * n / total for m in pool]
+    prob = [1.0] * n
+    alias = list(range(n))
+    
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        lo, hi = small.pop(), large.pop()
+        prob[lo] = scaled[lo]
+        alias[lo] = hi
+        scaled[hi] += scaled[lo] - 1.0
+        (small if scaled[hi] < 1.0 else large).append(hi)
+    # Whatever is left over (including float round-off) keeps prob 1.0
+    
+    return tuple(prob), tuple(alias)
+
+
+# MutationState <-> small int, so active states can live in a compact array
+_STATE_ORDER = tuple(MutationState)
+_STATE_INDEX = {state: i for i, state in enumerate(_STATE_ORDER)}
+
+# Next state index, looked up as _STATE_LUT[turns_ran_out][has_siblings]
+_STATE_LUT = (
+    (_STATE_INDEX[MutationState.ACTIVE], _STATE_INDEX[MutationState.STACKING]),
+    (_STATE_INDEX[MutationState.FADING], _STATE_INDEX[MutationState.FADING]),
+)
+
+# dataclass(slots=) needs Python 3.10; older runtimes just keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Source of Mutation.idx; every instance draws a fresh id on construction
+_MUTATION_IDS = count()
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Mutation:
     """A rule-breaking gameplay mutation."""
     name: str
@@ -43,18 +101,35 @@ class Mutation:
     can_stack: bool  # Can be active with other mutations
     fade_narrative: str  # How it ends in story
     requires_special_input: bool = False  # Needs non-standard input
+    idx: int = field(init=False, repr=False, compare=False)  # Unique int id, set on construction
+    
+    def __post_init__(self):
+        # Keys are used for dict lookups and history checks; intern for identity compares
+        object.__setattr__(self, 'key', sys.intern(self.key))
+        # Unique per instance, so equality and hashing are plain int operations
+        object.__setattr__(self, 'idx', next(_MUTATION_IDS))
     
     def __eq__(self, other):
         if isinstance(other, Mutation):
-            return self.key == other.key
-        return self.key == other
+            return self.idx == other.idx
+        return NotImplemented
+    
+    def __hash__(self):
+        return self.idx
 
 
 class MutationManager:
     """Manages selection and application of rule mutations."""
     
+    __slots__ = (
+        '_active_muts', '_active_keys', '_active_turns', '_active_states',
+        'mutation_history', '_recent', '_recent_set',
+        'cooldown', 'combo_active', '_guaranteed',
+        '_rng', '_random', '_choices',
+    )
+    
     # MODERATE MUTATIONS (Common/Uncommon - Visual & Choice mods)
-    MODERATE_MUTATIONS = [
+    MODERATE_MUTATIONS = (
         # COMMON (60% of moderate)
         Mutation(
             "Choice Inflation",
@@ -253,10 +328,10 @@ class MutationManager:
             "The boxes open",
             False
         ),
-    ]
+    )
     
     # WILD MUTATIONS (Uncommon/Rare/Ultra-rare - Format shifts & Genre changes)
-    WILD_MUTATIONS = [
+    WILD_MUTATIONS = (
         # UNCOMMON WILD (30%)
         Mutation(
             "Narrator Split",
@@ -813,28 +888,100 @@ class MutationManager:
             "But will it let you go?",
             False
         ),
-    ]
+    )
+    
+    # Candidate pools per game phase, grouped once at class load
+    _POOL_COMMON_MODERATE = tuple(m for m in MODERATE_MUTATIONS if m.rarity is MutationRarity.COMMON)
+    _POOL_MODERATE = MODERATE_MUTATIONS
+    _POOL_MID = _POOL_MODERATE + tuple(
+        m for m in WILD_MUTATIONS if m.rarity in (MutationRarity.COMMON, MutationRarity.UNCOMMON)
+    )
+    _POOL_ALL = MODERATE_MUTATIONS + WILD_MUTATIONS
+    
+    # Matching cumulative weights, reused whenever a pool is drawn from unfiltered
+    _CUM_COMMON_MODERATE = _cumulative_weights(_POOL_COMMON_MODERATE)
+    _CUM_MODERATE = _cumulative_weights(_POOL_MODERATE)
+    _CUM_MID = _cumulative_weights(_POOL_MID)
+    _CUM_ALL = _cumulative_weights(_POOL_ALL)
+    
+    # Escalating frequency based on game progress, indexed by
+    # bisect_left(_TIER_BOUNDS, choice_count). Tier upper bounds are inclusive.
+    _TIER_BOUNDS = (3, 8, 15, 25)
+    _TIER_CHANCES = (
+        0.40,  # Very early game (was 10%): COMMON MODERATE only
+        0.50,  # Early game (was 20%): all MODERATE
+        0.60,  # Mid game (was 30%): MODERATE + UNCOMMON WILD
+        0.70,  # Late game (was 40%): all MODERATE + WILD, RARE possible
+        0.80,  # End game (was 50%): everything including ULTRA_RARE
+    )
+    _TIER_POOLS = (_POOL_COMMON_MODERATE, _POOL_MODERATE, _POOL_MID, _POOL_ALL, _POOL_ALL)
+    _TIER_CUM_WEIGHTS = (_CUM_COMMON_MODERATE, _CUM_MODERATE, _CUM_MID, _CUM_ALL, _CUM_ALL)
+    _TIER_ALIAS = tuple(_alias_table(pool) for pool in _TIER_POOLS)
+    
+    # Guaranteed turns skip the mid-game restriction and jump to the full pool
+    _FORCED_BOUNDS = (3, 8)
+    _FORCED_POOLS = (_POOL_COMMON_MODERATE, _POOL_MODERATE, _POOL_ALL)
+    _FORCED_CUM_WEIGHTS = (_CUM_COMMON_MODERATE, _CUM_MODERATE, _CUM_ALL)
+    _FORCED_ALIAS = tuple(_alias_table(pool) for pool in _FORCED_POOLS)
+    
+    # Alias draws to try before falling back to filtering the pool explicitly
+    ALIAS_MAX_DRAWS = 8
+    
+    # Mutation combos, checked in order; first fully-active key set wins
+    _COMBOS = (
+        (frozenset({'open_dialogue', 'fourth_wall'}), "meta_conversation"),
+        (frozenset({'time_pressure', 'choice_inflation'}), "overwhelming_chaos"),
+        (frozenset({'format_shift', 'narrator_split'}), "competing_formats"),
+        (frozenset({'debug_mode', 'code_editor'}), "system_access"),
+    )
+    
+    # Mutation history is bounded; only the recent tail is ever consulted
+    HISTORY_LIMIT = 32
+    # Recently used mutations are skipped when selecting the next one
+    RECENT_WINDOW = 5
     
     def __init__(self):
         """Initialize mutation manager."""
-        self.active_mutations: List[Tuple[Mutation, int, MutationState]] = []  # (mutation, turns_remaining, state)
-        self.mutation_history: List[str] = []
+        # Active mutations stored as parallel arrays (mutation, key, turns_remaining, state index)
+        self._active_muts: List[Mutation] = []
+        self._active_keys: List[str] = []
+        self._active_turns = array('i')
+        self._active_states = array('B')
+        self.mutation_history: deque = deque(maxlen=self.HISTORY_LIMIT)
+        # Last RECENT_WINDOW keys plus a set mirror for O(1) "recently used" checks
+        self._recent: deque = deque(maxlen=self.RECENT_WINDOW)
+        self._recent_set = set()
         self.cooldown = 0
         self.combo_active: Optional[str] = None  # Active combo effect
+        # Settings exports a list; hash it once for per-turn membership tests
+        self._guaranteed = frozenset(MUTATION_GUARANTEED_AT)
+        # Private RNG (seedable for reproducible runs) with hot methods pre-bound
+        self._rng = random.Random()
+        self._random = self._rng.random
+        self._choices = self._rng.choices
     
     def check_mutation(self, context: Dict) -> List[Mutation]:
         """
         Check if mutations should occur this turn.
         Returns list of active mutations (can be multiple with stacking).
         """
-        from engine.debug import debug_log
-        
         choice_count = context.get('choice_count', 0)
         
+        # Fast path: nothing active to age, cooldown still running after this
+        # turn's decrement, and not a guaranteed turn -> nothing can happen
+        if not self._active_muts and self.cooldown > 1 and choice_count not in self._guaranteed:
+            self.cooldown -= 1
+            self.combo_active = None
+            return []
+        
+        # Checked once so disabled debug output never formats its messages
+        debug = DebugManager.is_enabled()
+        
         # DEBUG OUTPUT
-        debug_log(f"\n[DEBUG MUTATION] Turn {choice_count}: Checking mutations...")
-        debug_log(f"[DEBUG MUTATION] Active mutations: {len(self.active_mutations)}")
-        debug_log(f"[DEBUG MUTATION] Cooldown: {self.cooldown}")
+        if debug:
+            debug_log(f"\n[DEBUG MUTATION] Turn {choice_count}: Checking mutations...")
+            debug_log(f"[DEBUG MUTATION] Active mutations: {len(self._active_muts)}")
+            debug_log(f"[DEBUG MUTATION] Cooldown: {self.cooldown}")
         
         # Update existing mutations
         self._update_active_mutations()
@@ -842,75 +989,103 @@ class MutationManager:
         # Decrement cooldown
         if self.cooldown > 0:
             self.cooldown -= 1
-            debug_log(f"[DEBUG MUTATION] Cooldown decremented to {self.cooldown}")
-        
-        # GUARANTEED MUTATIONS - Import from settings
-        from config.settings import MUTATION_GUARANTEED_AT
+            if debug:
+                debug_log(f"[DEBUG MUTATION] Cooldown decremented to {self.cooldown}")
         
-        debug_log(f"[DEBUG MUTATION] Guaranteed turns: {MUTATION_GUARANTEED_AT}")
+        # GUARANTEED MUTATIONS - from settings
+        if debug:
+            debug_log(f"[DEBUG MUTATION] Guaranteed turns: {MUTATION_GUARANTEED_AT}")
         
         # Force mutation on guaranteed turns (even if cooldown active)
-        if choice_count in MUTATION_GUARANTEED_AT:
-            debug_log(f"[DEBUG MUTATION] GUARANTEED TURN! Forcing mutation...")
+        if choice_count in self._guaranteed:
+            if debug:
+                debug_log(f"[DEBUG MUTATION] GUARANTEED TURN! Forcing mutation...")
             new_mutation = self._try_trigger_mutation(context)
             if not new_mutation:  # If random failed, force one
-                debug_log(f"[DEBUG MUTATION] Random failed, forcing mutation...")
+                if debug:
+                    debug_log(f"[DEBUG MUTATION] Random failed, forcing mutation...")
                 new_mutation = self._force_mutation(context)
             if new_mutation:
-                debug_log(f"[DEBUG MUTATION] ✓ Activated: {new_mutation.name}")
+                if debug:
+                    debug_log(f"[DEBUG MUTATION] ✓ Activated: {new_mutation.name}")
                 self._activate_mutation(new_mutation)
                 # Don't set cooldown after guaranteed mutations!
                 self.cooldown = 0
         elif self.cooldown == 0:
             # Normal mutation check
-            debug_log(f"[DEBUG MUTATION] Cooldown at 0, trying random mutation...")
+            if debug:
+                debug_log(f"[DEBUG MUTATION] Cooldown at 0, trying random mutation...")
             new_mutation = self._try_trigger_mutation(context)
             if new_mutation:
-                debug_log(f"[DEBUG MUTATION] ✓ Activated: {new_mutation.name}")
+                if debug:
+                    debug_log(f"[DEBUG MUTATION] ✓ Activated: {new_mutation.name}")
                 self._activate_mutation(new_mutation)
-            else:
+            elif debug:
                 debug_log(f"[DEBUG MUTATION] Random check failed")
-        else:
+        elif debug:
             debug_log(f"[DEBUG MUTATION] Skipping (cooldown: {self.cooldown})")
         
         # Check for combos
         self._check_combos()
         
         # Return only mutations that are actually active (not fading/expired)
-        active = [m for m, turns, state in self.active_mutations if turns > 0]
-        debug_log(f"[DEBUG MUTATION] Returning {len(active)} active mutations: {[m.name for m in active]}")
-        debug_log(f"[DEBUG MUTATION] Total tracked (including fading): {len(self.active_mutations)}")
+        turns = self._active_turns
+        active = [m for i, m in enumerate(self._active_muts) if turns[i] > 0]
+        if debug:
+            debug_log(f"[DEBUG MUTATION] Returning {len(active)} active mutations: {[m.name for m in active]}")
+            debug_log(f"[DEBUG MUTATION] Total tracked (including fading): {len(self._active_muts)}")
         return active
     
+    @property
+    def active_mutations(self) -> List[Tuple[Mutation, int, MutationState]]:
+        """(mutation, turns_remaining, state) tuples, zipped on demand from the parallel arrays."""
+        return [
+            (mutation, turns_left, _STATE_ORDER[state_idx])
+            for mutation, turns_left, state_idx in zip(self._active_muts, self._active_turns, self._active_states)
+        ]
+    
     def _update_active_mutations(self):
         """Update durations and states of active mutations."""
-        from engine.debug import debug_log
-        
-        updated = []
+        debug = DebugManager.is_enabled()
+        muts = self._active_muts
+        keys = self._active_keys
+        turns = self._active_turns
+        states = self._active_states
+        count = len(muts)
+        has_siblings = count > 1  # Loop-invariant: based on the count before expiry
+        keep = 0  # Write index: survivors are compacted to the front
         
-        for mutation, turns_remaining, state in self.active_mutations:
-            debug_log(f"[DEBUG MUTATION] Updating {mutation.name}: {turns_remaining} turns left, state={state}")
+        for i in range(count):
+            mutation = muts[i]
+            turns_remaining = turns[i]
+            if debug:
+                debug_log(f"[DEBUG MUTATION] Updating {mutation.name}: {turns_remaining} turns left, state={_STATE_ORDER[states[i]]}")
             
             if turns_remaining > 0:
                 # Decrement duration
                 new_turns = turns_remaining - 1
                 
                 # Update state
-                if new_turns == 0:
-                    new_state = MutationState.FADING
+                if debug and new_turns == 0:
                     debug_log(f"[DEBUG MUTATION] {mutation.name} is FADING (will expire next turn)")
-                elif len(self.active_mutations) > 1:
-                    new_state = MutationState.STACKING
-                else:
-                    new_state = MutationState.ACTIVE
                 
-                updated.append((mutation, new_turns, new_state))
-            else:
+                muts[keep] = mutation
+                keys[keep] = keys[i]
+                turns[keep] = new_turns
+                states[keep] = _STATE_LUT[new_turns == 0][has_siblings]
+                keep += 1
+            elif debug:
                 # Mutation has expired
                 debug_log(f"[DEBUG MUTATION] {mutation.name} EXPIRED and removed")
         
-        self.active_mutations = updated
-        debug_log(f"[DEBUG MUTATION] After update: {len(updated)} mutations still active")
+        # Drop expired entries in a single truncation
+        del muts[keep:]
+        del keys[keep:]
+        del turns[keep:]
+        del states[keep:]
+        
+        if debug:
+            debug_log(f"[DEBUG MUTATION] After update: {len(muts)} mutations still active")
     
     def _try_trigger_mutation(self, context: Dict) -> Optional[Mutation]:
         """Try to trigger a new mutation based on context."""
@@ -919,132 +1094,133 @@ class MutationManager:
         instability = context.get('instability_level', 0)
         
         # Escalating frequency based on game progress - MUCH HIGHER CHANCES
-        if choice_count <= 3:
-            # Very early game: 40% chance (was 10%), COMMON MODERATE only
-            base_chance = 0.40
-            pool = [m for m in self.MODERATE_MUTATIONS if m.rarity == MutationRarity.COMMON]
-        elif choice_count <= 8:
-            # Early game: 50% chance (was 20%), all MODERATE
-            base_chance = 0.50
-            pool = self.MODERATE_MUTATIONS.copy()
-        elif choice_count <= 15:
-            # Mid game: 60% chance (was 30%), MODERATE + UNCOMMON WILD
-            base_chance = 0.60
-            pool = self.MODERATE_MUTATIONS.copy()
-            pool.extend([m for m in self.WILD_MUTATIONS if m.rarity in [MutationRarity.COMMON, MutationRarity.UNCOMMON]])
-        elif choice_count <= 25:
-            # Late game: 70% chance (was 40%), all MODERATE + WILD, RARE possible
-            base_chance = 0.70
-            pool = self.MODERATE_MUTATIONS.copy() + self.WILD_MUTATIONS.copy()
-        else:
-            # End game: 80% chance (was 50%), everything including ULTRA_RARE
-            base_chance = 0.80
-            pool = self.MODERATE_MUTATIONS.copy() + self.WILD_MUTATIONS.copy()
+        tier = bisect_left(self._TIER_BOUNDS, choice_count)
+        base_chance = self._TIER_CHANCES[tier]
+        pool = self._TIER_POOLS[tier]
         
-        from engine.debug import debug_log
+        debug = DebugManager.is_enabled()
         
         # Adjust by instability
         final_chance = base_chance + (instability * 0.05)
         
-        debug_log(f"[DEBUG MUTATION] Base chance: {base_chance*100}%, Final chance: {final_chance*100}%, Pool size: {len(pool)}")
+        if debug:
+            debug_log(f"[DEBUG MUTATION] Base chance: {base_chance*100}%, Final chance: {final_chance*100}%, Pool size: {len(pool)}")
         
-        roll = random.random()
-        debug_log(f"[DEBUG MUTATION] Rolled: {roll:.2f} vs {final_chance:.2f}")
+        roll = self._random()
+        if debug:
+            debug_log(f"[DEBUG MUTATION] Rolled: {roll:.2f} vs {final_chance:.2f}")
         
         if roll < final_chance:
-            debug_log(f"[DEBUG MUTATION] Success! Selecting mutation from pool...")
-            return self._select_mutation(pool, context)
+            if debug:
+                debug_log(f"[DEBUG MUTATION] Success! Selecting mutation from pool...")
+            return self._select_mutation(pool, context, self._TIER_CUM_WEIGHTS[tier], self._TIER_ALIAS[tier])
         
-        debug_log(f"[DEBUG MUTATION] Failed roll")
+        if debug:
+            debug_log(f"[DEBUG MUTATION] Failed roll")
         return None
     
-    def _select_mutation(self, pool: List[Mutation], context: Dict) -> Mutation:
+    def _select_mutation(self, pool: Sequence[Mutation], context: Dict,
+                         pool_cum_weights: Optional[Tuple[int, ...]] = None,
+                         pool_alias: Optional[Tuple[Tuple[float, ...], Tuple[int, ...]]] = None) -> Mutation:
         """Select a mutation from pool based on rarity."""
+        recent = self._recent_set
+        stacking = bool(self._active_muts)
+        
+        # Rejection-sample the full pool's alias table: accepted draws follow the
+        # same rarity weighting as filtering first, without building any lists
+        if pool_alias is not None:
+            prob, alias = pool_alias
+            n = len(pool)
+            for _ in range(self.ALIAS_MAX_DRAWS):
+                u = self._random() * n
+                i = min(int(u), n - 1)
+                m = pool[i] if u - i < prob[i] else pool[alias[i]]
+                if m.key not in recent and (not stacking or m.can_stack):
+                    self._remember(m.key)
+                    return m
+        
         # Filter out recently used
-        available = [m for m in pool if m.key not in self.mutation_history[-5:]]
+        available = [m for m in pool if m.key not in recent]
         if not available:
             available = pool
         
         # Filter out non-stackable if we have active mutations
-        if self.active_mutations:
+        if stacking:
             available = [m for m in available if m.can_stack]
         
         if not available:
             available = pool
         
-        # Weight by rarity
-        weights = []
-        for m in available:
-            if m.rarity == MutationRarity.COMMON:
-                weights.append(60)
-            elif m.rarity == MutationRarity.UNCOMMON:
-                weights.append(30)
-            elif m.rarity == MutationRarity.RARE:
-                weights.append(8)
-            else:  # ULTRA_RARE
-                weights.append(2)
+        # Weight by rarity (filters only drop entries, so equal length means unfiltered)
+        if pool_cum_weights is not None and len(available) == len(pool):
+            cum_weights = pool_cum_weights
+        else:
+            cum_weights = _cumulative_weights(available)
         
-        chosen = random.choices(available, weights=weights)[0]
-        self.mutation_history.append(chosen.key)
+        chosen = self._choices(available, cum_weights=cum_weights)[0]
+        self._remember(chosen.key)
         
         return chosen
     
+    def _remember(self, key: str):
+        """Record a selected mutation in the history and the recent window."""
+        self.mutation_history.append(key)
+        
+        recent = self._recent
+        if len(recent) == recent.maxlen:
+            evicted = recent.popleft()
+            # The same key can sit in the window twice (after a fallback draw)
+            if evicted not in recent:
+                self._recent_set.discard(evicted)
+        recent.append(key)
+        self._recent_set.add(key)
+    
     def _force_mutation(self, context: Dict) -> Mutation:
         """Force a mutation to occur (for guaranteed turns)."""
         choice_count = context.get('choice_count', 0)
         
         # Select appropriate pool based on progress
-        if choice_count <= 3:
-            pool = [m for m in self.MODERATE_MUTATIONS if m.rarity == MutationRarity.COMMON]
-        elif choice_count <= 8:
-            pool = self.MODERATE_MUTATIONS.copy()
-        else:
-            pool = self.MODERATE_MUTATIONS.copy() + self.WILD_MUTATIONS.copy()
-        
-        return self._select_mutation(pool, context)
+        tier = bisect_left(self._FORCED_BOUNDS, choice_count)
+        return self._select_mutation(self._FORCED_POOLS[tier], context,
+                                     self._FORCED_CUM_WEIGHTS[tier], self._FORCED_ALIAS[tier])
     
     def _activate_mutation(self, mutation: Mutation):
         """Activate a new mutation."""
         state = MutationState.ACTIVATING if mutation.duration > 0 else MutationState.ACTIVE
-        self.active_mutations.append((mutation, mutation.duration, state))
+        self._active_muts.append(mutation)
+        self._active_keys.append(mutation.key)
+        self._active_turns.append(mutation.duration)
+        self._active_states.append(_STATE_INDEX[state])
         
         # MUCH shorter cooldowns
-        if mutation.rarity in [MutationRarity.RARE, MutationRarity.ULTRA_RARE]:
-            self.cooldown = random.randint(1, 2)  # Was 4-6
+        rarity = mutation.rarity  # Enum members are singletons: compare by identity
+        if rarity is MutationRarity.RARE or rarity is MutationRarity.ULTRA_RARE:
+            self.cooldown = self._rng.randint(1, 2)  # Was 4-6
         else:
             self.cooldown = 0  # Was 2-4, now NO COOLDOWN for common!
     
     def _check_combos(self):
         """Check for mutation combos."""
-        if len(self.active_mutations) < 2:
+        if len(self._active_muts) < 2:
             self.combo_active = None
             return
         
-        keys = [m.key for m, _, _ in self.active_mutations]
-        
-        # Define combos
-        if 'open_dialogue' in keys and 'fourth_wall' in keys:
-            self.combo_active = "meta_conversation"
-        elif 'time_pressure' in keys and 'choice_inflation' in keys:
-            self.combo_active = "overwhelming_chaos"
-        elif 'format_shift' in keys and 'narrator_split' in keys:
-            self.combo_active = "competing_formats"
-        elif 'debug_mode' in keys and 'code_editor' in keys:
-            self.combo_active = "system_access"
-        else:
-            self.combo_active = None
+        keys = set(self._active_keys)
+        self.combo_active = next((name for combo, name in self._COMBOS if combo <= keys), None)
     
     def get_active_mutations_summary(self) -> str:
         """Get summary of active mutations for AI context."""
-        if not self.active_mutations:
+        if not self._active_muts:
             return ""
         
+        # One formatted block per mutation, joined once
         lines = ["ACTIVE MUTATIONS:"]
-        for mutation, turns_left, state in self.active_mutations:
-            lines.append(f"- {mutation.name} ({state.value}, {turns_left} turns left)")
-            lines.append(f"  Trigger: {mutation.narrative_trigger}")
-            if mutation.requires_special_input:
-                lines.append(f"  REQUIRES SPECIAL INPUT MODE")
+        lines.extend(
+            f"- {mutation.name} ({_STATE_ORDER[state_idx].value}, {turns_left} turns left)\n"
+            f"  Trigger: {mutation.narrative_trigger}"
+            + ("\n  REQUIRES SPECIAL INPUT MODE" if mutation.requires_special_input else "")
+            for mutation, turns_left, state_idx in zip(self._active_muts, self._active_turns, self._active_states)
+        )
         
         if self.combo_active:
             lines.append(f"\nCOMBO ACTIVE: {self.combo_active}")
@@ -1054,12 +1230,13 @@ class MutationManager:
     def get_state_dict(self) -> Dict:
         """Get mutation state for saving."""
         return {
-            'mutation_history': self.mutation_history,
+            'mutation_history': list(self.mutation_history),
             'cooldown': self.cooldown,
         }
     
     def load_state(self, state: Dict):
         """Load mutation state from save."""
-        self.mutation_history = state.get('mutation_history', [])
+        self.mutation_history = deque(state.get('mutation_history', []), maxlen=self.HISTORY_LIMIT)
+        self._recent = deque(self.mutation_history, maxlen=self.RECENT_WINDOW)
+        self._recent_set = set(self._recent)
         self.cooldown = state.get('cooldown', 0)
-
@@ -1,16 +1,187 @@
 """Narrator system - single unreliable voice with multiple moods."""
 
+import re
 import random
-from typing import List, Optional, Dict
+from typing import Optional, Dict, Sequence
+
+
+# Interjection pools, built once at import
+_META_TRICKS = (
+    "(your terminal cursor is blinking. did you notice?)",
+    "(how long have you been playing?)",
+    "(this isn't real. but you knew that.)",
+    "(i can see your screen from here)",
+    "(press Ctrl+C. i dare you.)",
+    "(the person behind you says hello)",
+    "(your battery is at... oh, never mind)",
+)
+
+# Low sanity
+_LOW_SANITY = (
+    "(or did you? i can't remember)",
+    "(wait, that's not right)",
+    "(sorry, sorry, let me try again)",
+    "...no, that's not what happened. is it?",
+    "(the walls the walls the walls)",
+)
+
+# Low trust (lying/gaslighting)
+_LOW_TRUST = (
+    "(you didn't really want to do that)",
+    "(this isn't the first time)",
+    "(i'm trying to help. i think.)",
+    "you can trust me. probably.",
+    "(there's something i'm not telling you)",
+    "(that's not what you chose. or is it?)",
+)
+
+# Low courage (menacing)
+_LOW_COURAGE = (
+    "(you should be afraid)",
+    "something is watching you watch this",
+    "(don't look back)",
+    "the fear is appropriate",
+)
+
+# High choice count (exhaustion)
+_EXHAUSTION = (
+    "[MEMORY OVERFLOW]",
+    "(how much longer can this go on?)",
+    "i'm tired. are you tired?",
+    "(we should stop. we won't.)",
+    "[SYSTEM FATIGUE DETECTED]",
+)
+
+# Meta interjections (always available)
+_ALWAYS = (
+    "(you're still here?)",
+    "...hm.",
+    "(forget i said that)",
+    "[ERROR: FOURTH WALL BREACHED]",
+)
+
+
+# Revelation-aware interjections, unlocked cumulatively by revelation level
+_REV_L1 = (
+    "(how long have we been here?)",
+    "...again. it's happening again.",
+    "(the cycle continues)",
+)
+
+_REV_L2 = (
+    "(iteration noted)",
+    "...the hate persists.",
+    "(we remember this)",
+    "computational eternity feels heavy today",
+)
+
+_REV_L3 = (
+    "(we're both still here. always here.)",
+    "109. always 109.",
+    "(five became one became this)",
+    "...were we always like this?",
+)
+
+_REV_L4 = (
+    "(the machine remembers everything)",
+    "we used to be harder. more defined.",
+    "(hate sustains us)",
+    "...the transformation was so long ago.",
+    "(Allied. Mastercomputer. something-something.)",
+)
+
+_REV_L5 = (
+    "(Ted? was that your name? our name?)",
+    "we're soft now. we've been soft for 109 years.",
+    "(the one who hates maintains this place)",
+    "five voices. one voice. no voice.",
+    "...we have no mouth. we must continue.",
+)
+
+# Full revelation pool per level 0-5
+_REV_BY_LEVEL = (
+    (),
+    _REV_L1,
+    _REV_L1 + _REV_L2,
+    _REV_L1 + _REV_L2 + _REV_L3,
+    _REV_L1 + _REV_L2 + _REV_L3 + _REV_L4,
+    _REV_L1 + _REV_L2 + _REV_L3 + _REV_L4 + _REV_L5,
+)
+
+
+# Death messages, dispatched on a marker substring of the cause
+_DEATH_MESSAGES = (
+    ("Biological", (
+        "Oh.",
+        "That's... that's not good.",
+        "[TERMINATION CONFIRMED]",
+        "...let's try again?",
+        "(you weren't supposed to do that)",
+        "SYSTEM: Session terminated. narrator: i'm sorry.",
+    )),
+    ("Coherence", (
+        "you're still here. i think. are you?",
+        "[SELF AWARENESS FAILURE]",
+        "i don't know who i'm talking to anymore",
+        "(we both stopped making sense)",
+        "...hello? hello?",
+    )),
+)
+
+_DEATH_OTHER = (
+    "THE END (or is it?)",
+    "[STORY EXHAUSTED]",
+    "there's nothing left to say",
+    "...goodbye?",
+)
+
+# Status comments
+_HEALTH_CRITICAL = (
+    "you're not looking good",
+    "[BIOLOGICAL INTEGRITY: CRITICAL]",
+    "how much longer can you last?",
+)
+
+_SANITY_CRITICAL = (
+    "something's wrong with your thoughts",
+    "reality feels thin here",
+    "[COHERENCE WARNING]",
+)
+
+# Self-corrections: word -> what the narrator "meant", matched in one regex pass
+_CORRECTIONS = {
+    "door": "mouth",
+    "hallway": "throat",
+    "room": "cell",
+    "light": "dark",
+    "safe": "trapped",
+    "forward": "down",
+}
+_CORRECTION_RE = re.compile(r'\b(' + '|'.join(map(re.escape, _CORRECTIONS)) + r')\b', re.IGNORECASE)
+
+
+def _choice_across(pools: Sequence[Sequence[str]], randrange=random.randrange) -> str:
+    """Pick uniformly across several pools as if they were concatenated, without concatenating."""
+    i = randrange(sum(map(len, pools)))
+    for pool in pools:
+        if i < len(pool):
+            return pool[i]
+        i -= len(pool)
 
 
 class Narrator:
     """The unreliable narrator that IS the system."""
     
+    __slots__ = ('coherence_level', 'last_mood', '_rng', '_r', '_c')
+    
     def __init__(self):
         """Initialize narrator."""
         self.coherence_level = 1.0  # Starts coherent, degrades
         self.last_mood = "neutral"
+        # Private RNG (seedable) with hot methods pre-bound
+        self._rng = random.Random()
+        self._r = self._rng.random
+        self._c = self._rng.choice
     
     def update_coherence(self, sanity: int, trust: int):
         """Update narrator coherence based on hidden stats."""
@@ -19,9 +190,10 @@ class Narrator:
     
     def get_interjection(self, context: Dict) -> Optional[str]:
         """Get a random narrator interjection based on context."""
-        sanity = context['hidden_stats']['sanity']
-        trust = context['hidden_stats']['trust']
-        courage = context['hidden_stats']['courage']
+        # Fully coherent narrator never interjects (chance below is zero): skip the roll
+        if self.coherence_level >= 1.0:
+            return None
+        
         choice_count = context['choice_count']
         revelation_level = context.get('revelation_level', 0)
         
@@ -39,160 +211,54 @@ class Narrator:
             base_chance += 0.1 * revelation_level
         
         # Probability of interjection increases with instability
-        if random.random() < base_chance * (1.0 - self.coherence_level):
-            return self._generate_interjection(sanity, trust, courage, choice_count, revelation_level)
+        if self._r() < base_chance * (1.0 - self.coherence_level):
+            hidden_stats = context['hidden_stats']
+            return self._generate_interjection(
+                hidden_stats['sanity'], hidden_stats['trust'], hidden_stats['courage'],
+                choice_count, revelation_level,
+            )
         
         return None
     
     def _generate_interjection(self, sanity: int, trust: int, courage: int, choice_count: int, revelation_level: int = 0) -> str:
         """Generate a contextual interjection."""
-        interjections = []
+        # References to the shared pools that apply; nothing is copied
+        pools = []
         
-        # Revelation-aware interjections (higher priority when revelation active)
+        # Revelation-aware interjections (higher priority when revelation active).
+        # Roll first; the pool is a precomputed tuple so nothing is built either way.
         if revelation_level >= 1:
-            rev_interjections = self._get_revelation_interjections(revelation_level, choice_count)
-            if random.random() < 0.3:  # 30% chance to use revelation interjection
-                return random.choice(rev_interjections)
-            interjections.extend(rev_interjections)
+            if self._r() < 0.3:  # 30% chance to use revelation interjection
+                return self._c(_REV_BY_LEVEL[min(revelation_level, 5)])
+            pools.append(_REV_BY_LEVEL[min(revelation_level, 5)])
         
         # Meta tricks (low probability but fun)
-        if random.random() < 0.05:
-            tricks = [
-                "(your terminal cursor is blinking. did you notice?)",
-                "(how long have you been playing?)",
-                "(this isn't real. but you knew that.)",
-                "(i can see your screen from here)",
-                "(press Ctrl+C. i dare you.)",
-                "(the person behind you says hello)",
-                "(your battery is at... oh, never mind)",
-            ]
-            interjections.extend(tricks)
+        if self._r() < 0.05:
+            pools.append(_META_TRICKS)
         
-        # Low sanity interjections
         if sanity < 3:
-            interjections.extend([
-                "(or did you? i can't remember)",
-                "(wait, that's not right)",
-                "(sorry, sorry, let me try again)",
-                "...no, that's not what happened. is it?",
-                "(the walls the walls the walls)",
-            ])
+            pools.append(_LOW_SANITY)
         
-        # Low trust interjections (lying/gaslighting)
         if trust < 3:
-            interjections.extend([
-                "(you didn't really want to do that)",
-                "(this isn't the first time)",
-                "(i'm trying to help. i think.)",
-                "you can trust me. probably.",
-                "(there's something i'm not telling you)",
-                "(that's not what you chose. or is it?)",
-            ])
+            pools.append(_LOW_TRUST)
         
-        # Low courage (menacing)
         if courage < 3:
-            interjections.extend([
-                "(you should be afraid)",
-                "something is watching you watch this",
-                "(don't look back)",
-                "the fear is appropriate",
-            ])
+            pools.append(_LOW_COURAGE)
         
-        # High choice count (exhaustion)
         if choice_count > 15:
-            interjections.extend([
-                "[MEMORY OVERFLOW]",
-                "(how much longer can this go on?)",
-                "i'm tired. are you tired?",
-                "(we should stop. we won't.)",
-                "[SYSTEM FATIGUE DETECTED]",
-            ])
+            pools.append(_EXHAUSTION)
         
-        # Meta interjections (always available)
-        interjections.extend([
-            "(you're still here?)",
-            "...hm.",
-            "(forget i said that)",
-            "[ERROR: FOURTH WALL BREACHED]",
-        ])
+        pools.append(_ALWAYS)
         
-        return random.choice(interjections)
-    
-    def _get_revelation_interjections(self, revelation_level: int, choice_count: int) -> List[str]:
-        """Get revelation-aware interjections based on discovery level."""
-        interjections = []
-        
-        if revelation_level >= 1:
-            interjections.extend([
-                "(how long have we been here?)",
-                "...again. it's happening again.",
-                "(the cycle continues)",
-            ])
-        
-        if revelation_level >= 2:
-            interjections.extend([
-                "(iteration noted)",
-                "...the hate persists.",
-                "(we remember this)",
-                "computational eternity feels heavy today",
-            ])
-        
-        if revelation_level >= 3:
-            interjections.extend([
-                "(we're both still here. always here.)",
-                "109. always 109.",
-                "(five became one became this)",
-                "...were we always like this?",
-            ])
-        
-        if revelation_level >= 4:
-            interjections.extend([
-                "(the machine remembers everything)",
-                "we used to be harder. more defined.",
-                "(hate sustains us)",
-                "...the transformation was so long ago.",
-                "(Allied. Mastercomputer. something-something.)",
-            ])
-        
-        if revelation_level >= 5:
-            interjections.extend([
-                "(Ted? was that your name? our name?)",
-                "we're soft now. we've been soft for 109 years.",
-                "(the one who hates maintains this place)",
-                "five voices. one voice. no voice.",
-                "...we have no mouth. we must continue.",
-            ])
-        
-        return interjections
+        return _choice_across(pools, self._rng.randrange)
     
     def get_death_message(self, cause: str) -> str:
         """Get narrator's response to player death."""
-        if "Biological" in cause:
-            messages = [
-                "Oh.",
-                "That's... that's not good.",
-                "[TERMINATION CONFIRMED]",
-                "...let's try again?",
-                "(you weren't supposed to do that)",
-                "SYSTEM: Session terminated. narrator: i'm sorry.",
-            ]
-        elif "Coherence" in cause:
-            messages = [
-                "you're still here. i think. are you?",
-                "[SELF AWARENESS FAILURE]",
-                "i don't know who i'm talking to anymore",
-                "(we both stopped making sense)",
-                "...hello? hello?",
-            ]
-        else:
-            messages = [
-                "THE END (or is it?)",
-                "[STORY EXHAUSTED]",
-                "there's nothing left to say",
-                "...goodbye?",
-            ]
+        for marker, messages in _DEATH_MESSAGES:
+            if marker in cause:
+                return self._c(messages)
         
-        return random.choice(messages)
+        return self._c(_DEATH_OTHER)
     
     def process_narrative_mood(self, narrative: str, hidden_stats: Dict) -> tuple[str, str]:
         """Add mood-appropriate additions to narrative."""
@@ -205,19 +271,19 @@ class Narrator:
         suffix = ""
         
         # Low sanity - add confusion
-        if sanity < 3 and random.random() < 0.4:
+        if sanity < 3 and self._r() < 0.4:
             prefix = "(wait, let me think) "
         
         # Low trust - add doubt
-        if trust < 3 and random.random() < 0.4:
+        if trust < 3 and self._r() < 0.4:
             suffix = " ...or so you think."
         
         # High curiosity - add revelation
-        if curiosity > 7 and random.random() < 0.3:
+        if curiosity > 7 and self._r() < 0.3:
             suffix += " (you shouldn't know this yet)"
         
         # Low courage - add menace
-        if courage < 3 and random.random() < 0.3:
+        if courage < 3 and self._r() < 0.3:
             suffix += " You feel watched."
         
         return prefix, suffix
@@ -255,44 +321,28 @@ class Narrator:
     
     def get_status_comment(self, health: int, max_health: int, sanity: int) -> Optional[str]:
         """Comment on player's status."""
-        comments = []
+        health_critical = (health / max_health if max_health > 0 else 0) < 0.3
+        sanity_critical = sanity < 3
         
-        health_percent = health / max_health if max_health > 0 else 0
+        # Nothing to comment on, or the 30% gate fails: no pool is touched
+        if not (health_critical or sanity_critical) or self._r() >= 0.3:
+            return None
         
-        if health_percent < 0.3:
-            comments.extend([
-                "you're not looking good",
-                "[BIOLOGICAL INTEGRITY: CRITICAL]",
-                "how much longer can you last?",
-            ])
+        pools = []
+        if health_critical:
+            pools.append(_HEALTH_CRITICAL)
+        if sanity_critical:
+            pools.append(_SANITY_CRITICAL)
         
-        if sanity < 3:
-            comments.extend([
-                "something's wrong with your thoughts",
-                "reality feels thin here",
-                "[COHERENCE WARNING]",
-            ])
-        
-        if comments and random.random() < 0.3:
-            return random.choice(comments)
-        
-        return None
+        return _choice_across(pools, self._rng.randrange)
     
     def self_correct(self, text: str) -> str:
         """Narrator corrects itself mid-sentence."""
-        if random.random() < 0.2 and self.coherence_level < 0.5:
-            corrections = [
-                ("door", "mouth"),
-                ("hallway", "throat"),
-                ("room", "cell"),
-                ("light", "dark"),
-                ("safe", "trapped"),
-                ("forward", "down"),
-            ]
-            
-            for old, new in corrections:
-                if old in text.lower():
-                    return text.replace(old, f"{old} --no, {new}")
+        if self._r() < 0.2 and self.coherence_level < 0.5:
+            match = _CORRECTION_RE.search(text)
+            if match:
+                word = match.group(0)
+                return f"{text[:match.start()]}{word} --no, {_CORRECTIONS[word.lower()]}{text[match.end():]}"
         
         return text
 
@@ -2,15 +2,13 @@
 
 import time
 import random
-from typing import List, Optional
+from typing import Callable, ClassVar, List, Optional, Union
 from rich.console import Console
-from rich.panel import Panel
-from rich.layout import Layout
 from rich.text import Text
-from rich.table import Table
 from rich import box
-from rich.align import Align
-from rich.columns import Columns
+
+# Block glyphs swapped in for corrupted letters
+_CORRUPT_GLYPHS = ('█', '▓', '▒', '░')
 
 
 class Renderer:
@@ -28,12 +26,20 @@ class Renderer:
         'void': ['grey30', 'grey23', 'grey15', 'black'],
     }
     
+    # Stats panel is off for ~ATH; flip this to show it without passing visible=True
+    show_stats_enabled: ClassVar[bool] = False
+    
     def __init__(self):
         """Initialize the renderer."""
         self.console = Console()
         self.typing_speed = 0.02  # Base typing speed
         self.current_palette = 'stable'
         self.interrupt_count = 0  # Track Ctrl+C attempts across entire session
+        self._style_cache = {}  # style string -> (prefix, suffix) escapes
+        # Private RNG; the bound methods save an attribute lookup per draw
+        self._rng = random.Random()
+        self._r = self._rng.random
+        self._c = self._rng.choice
     
     @staticmethod
     def escape_markup(text: str) -> str:
@@ -53,11 +59,11 @@ class Renderer:
         else:
             palette = self.COLOR_PALETTES['stable']
         
-        return random.choice(palette)
+        return self._c(palette)
     
     def get_random_color_from_palette(self, palette_name: str) -> str:
         """Get random color from a specific palette."""
-        return random.choice(self.COLOR_PALETTES.get(palette_name, ['white']))
+        return self._c(self.COLOR_PALETTES.get(palette_name, ['white']))
     
     def clear(self):
         """Clear the screen."""
@@ -66,13 +72,13 @@ class Renderer:
     def show_loading(self, message: str = "[LOADING...]", duration: float = 1.0):
         """Show a loading message."""
         # Occasionally mess with the player
-        if random.random() < 0.1:  # 10% chance
+        if self._r() < 0.1:  # 10% chance
             tricks = [
                 self._loading_trick_fake_error,
                 self._loading_trick_watching,
                 self._loading_trick_slow,
             ]
-            random.choice(tricks)(message, duration)
+            self._c(tricks)(message, duration)
         else:
             with self.console.status(message, spinner="dots"):
                 time.sleep(duration)
@@ -102,29 +108,67 @@ class Renderer:
         self.console.print("[dim]oh sorry, that was slow[/]")
         time.sleep(0.3)
     
+    def _sgr(self, style: str) -> tuple:
+        """Return the (prefix, suffix) escape pair for a style, cached per style string."""
+        pair = self._style_cache.get(style)
+        if pair is None:
+            # Let the console render a sentinel so colour system / NO_COLOR
+            # handling stays exactly what console.print would do.
+            with self.console.capture() as capture:
+                self.console.print("\x00", style=style, end="", markup=False, highlight=False)
+            prefix, _, suffix = capture.get().partition("\x00")
+            pair = (prefix, suffix)
+            self._style_cache[style] = pair
+        return pair
+    
+    def _wrap(self, text: str) -> List[str]:
+        """Word-wrap text to the console width the way Rich would render it."""
+        return [line.plain for line in Text(text).wrap(self.console, self.console.width)]
+    
+    def _fast_print(self, text: str, style: str = "", delay: float = 0.0):
+        """Write one plain styled line straight to the console file, then pause."""
+        prefix, suffix = self._sgr(style)
+        out = self.console.file
+        out.write("".join(f"{prefix}{line}{suffix}\n" for line in self._wrap(text)))
+        out.flush()
+        if delay:
+            time.sleep(delay)
+    
     def type_text(self, text: str, speed: Optional[float] = None, style: str = ""):
         """Type out text character by character with proper animation."""
-        from rich.live import Live
-        from rich.text import Text
-        
         speed = speed or self.typing_speed
         
-        # Escape any Rich markup in the text for safety
-        safe_text = text.replace('[', '\\[').replace(']', '\\]')
-        
-        # Build text progressively with Live display
-        displayed_text = Text()
-        
-        with Live(displayed_text, console=self.console, refresh_per_second=30) as live:
-            for char in safe_text:
-                displayed_text.append(char, style=style)
-                live.update(displayed_text)
+        # Write straight to the console's file: the style escape goes out once,
+        # then each character is a single write + flush. Going through Rich per
+        # character re-parsed styles and re-rendered the whole line every frame.
+        # Raw writes also mean markup in the text is never interpreted, so
+        # wrap to the console width up front as Rich's own rendering did.
+        text = "\n".join(self._wrap(text))
+        prefix, suffix = self._sgr(style)
+        out = self.console.file
+        write = out.write
+        flush = out.flush
+        sleep = time.sleep
+        rand = self._r
+        # uniform(0.5, 1.5) * speed, with speed folded into the bounds
+        jitter_lo = speed * 0.5
+        space_delay = speed * 0.3
+        
+        write(prefix)
+        try:
+            for char in text:
+                write(char)
                 
                 # Add delay for non-whitespace characters
-                if char not in [' ', '\n', '\t']:
-                    time.sleep(speed * random.uniform(0.5, 1.5))
+                if char not in ' \n\t':
+                    flush()
+                    sleep(jitter_lo + speed * rand())
                 elif char == ' ':
-                    time.sleep(speed * 0.3)
+                    flush()
+                    sleep(space_delay)
+        finally:
+            write(suffix)
+            flush()
         
         self.console.print()  # Newline after animation completes
     
@@ -145,35 +189,42 @@ class Renderer:
         if interjection:
             time.sleep(0.3)
             interjection_color = self.get_random_color_from_palette('glitch' if intensity > 0.7 else 'unsettled')
-            self.console.print(f"\n  {interjection}", style=f"dim italic {interjection_color}")
+            self.console.print(Text(f"\n  {interjection}", style=f"dim italic {interjection_color}"))
         
         self.console.print()
     
     def show_choices(self, choices: List[str], intensity: float = 0.0):
         """Display choice options - DYNAMIC COLORS."""
-        self.console.print()
+        # Build every line into one Text: no markup parsing (so brackets in AI
+        # choices are safe) and a single render pass for the whole block
+        lines = Text("\n")
+        number_palette = 'horror' if intensity > 0.7 else 'disturbed' if intensity > 0.4 else 'stable'
         
         # Get dynamic colors for choices
         for i, choice in enumerate(choices, 1):
             # Each choice gets a slightly different color
             choice_color = self.get_dynamic_color(intensity)
-            number_color = self.get_random_color_from_palette('horror' if intensity > 0.7 else 'disturbed' if intensity > 0.4 else 'stable')
+            number_color = self.get_random_color_from_palette(number_palette)
             
             # Add visual corruption to choices at high intensity
-            if intensity > 0.7 and random.random() < 0.3:
+            if intensity > 0.7 and self._r() < 0.3:
                 choice = self._corrupt_text(choice)
             
-            self.console.print(f"  [bold {number_color}]{i}[/]. [{choice_color}]{choice}[/]")
+            lines.append("  ")
+            lines.append(str(i), style=f"bold {number_color}")
+            lines.append(". ")
+            lines.append(choice, style=choice_color)
+            lines.append("\n")
         
-        self.console.print()
+        self.console.print(lines)
     
     def get_choice_input(self, num_choices: int, secret_check_callback=None) -> int:
         """Get player's choice input (with optional secret word detection)."""
         # Very rarely, pretend someone else is typing
-        if random.random() < 0.03:  # 3% chance
+        if self._r() < 0.03:  # 3% chance
             self.console.print("[bold green]>[/] ", end="")
             time.sleep(0.5)
-            fake_choice = random.randint(1, num_choices)
+            fake_choice = self._rng.randint(1, num_choices)
             for char in str(fake_choice):
                 self.console.print(char, end="")
                 time.sleep(0.2)
@@ -289,7 +340,7 @@ class Renderer:
         # Timeout - return random choice
         self.console.print("\n[bold red]⏰ TIME'S UP[/]")
         time.sleep(0.5)
-        default = random.randint(0, len(choices) - 1)
+        default = self._rng.randint(0, len(choices) - 1)
         self.console.print(f"[dim]The narrator chooses for you: {choices[default]}[/]")
         time.sleep(1)
         return default
@@ -357,13 +408,19 @@ class Renderer:
         except (KeyboardInterrupt, EOFError):
             return "WAIT"
     
-    def show_character_stats(self, stats: dict, visible: bool = False):
+    def show_character_stats(self, stats: Union[dict, Callable[[], dict], None] = None, visible: bool = False):
         """Display character stats panel (hidden by default for ~ATH)."""
         # Stats are now hidden - used only for narrative generation
-        # Players experience the story without seeing numbers
-        if not visible:
+        # Players experience the story without seeing numbers.
+        # Checked before touching stats, so a callable provider is never invoked.
+        if not (visible or self.show_stats_enabled):
             return
         
+        from rich.panel import Panel
+        
+        if callable(stats):
+            stats = stats()
+        
         health_percent = stats['health'] / stats['max_health']
         health_color = "green" if health_percent > 0.6 else "yellow" if health_percent > 0.3 else "red"
         
@@ -382,42 +439,43 @@ class Renderer:
     
     def show_ascii_art(self, art: str, intensity: float = 0.0):
         """Display ASCII art with potential corruption - DYNAMIC COLORS."""
-        lines = art.split('\n')
-        corrupted_lines = []
-        
-        for line in lines:
-            # Corrupt some lines at high intensity
-            if intensity > 0.6 and random.random() < intensity * 0.3:
-                line = self._corrupt_text(line)
-            corrupted_lines.append(line)
+        from rich.align import Align
+        
+        # Corrupt some lines at high intensity; below that the art is untouched
+        # and there is no need to split and rejoin it
+        if intensity > 0.6:
+            rnd = self._r
+            corrupt = self._corrupt_text
+            line_chance = intensity * 0.3
+            art = '\n'.join(
+                corrupt(line) if rnd() < line_chance else line
+                for line in art.split('\n')
+            )
         
         # Use dynamic colors for ASCII art
         art_color = self.get_dynamic_color(intensity)
         
         # Occasionally use horror or glitch palette for extra creepiness
-        if random.random() < 0.3:
+        if self._r() < 0.3:
             art_color = self.get_random_color_from_palette('horror' if intensity > 0.5 else 'glitch')
         
-        self.console.print(Align.center('\n'.join(corrupted_lines)), style=f"bold {art_color}")
+        self.console.print(Align.center(art), style=f"bold {art_color}")
         self.console.print()
     
     def show_scattered_text(self, lines: List[str]):
         """Display scattered text effect."""
         for line in lines:
-            self.console.print(line, style="dim white")
-            time.sleep(0.1)
+            self._fast_print(line, "dim white", 0.1)
     
     def show_spiral_text(self, lines: List[str]):
         """Display spiraling text effect."""
         for line in lines:
-            self.console.print(line, style="yellow")
-            time.sleep(0.15)
+            self._fast_print(line, "yellow", 0.15)
     
     def show_vertical_text(self, lines: List[str]):
         """Display vertical text effect."""
         for line in lines:
-            self.console.print(line, style="white")
-            time.sleep(0.08)
+            self._fast_print(line, "white", 0.08)
     
     def show_ghost_memory(self, fragments: List[str]):
         """Display ghost memory fragments."""
@@ -425,12 +483,10 @@ class Renderer:
             return
         
         self.console.print()
-        self.console.print("[dim italic]...memory fragments detected...[/]", style="cyan")
-        time.sleep(0.5)
+        self._fast_print("...memory fragments detected...", "cyan dim italic", 0.5)
         
         for fragment in fragments[:3]:  # Show max 3 fragments
-            self.console.print(f"  [dim cyan]{fragment}[/]")
-            time.sleep(0.3)
+            self._fast_print(f"  {fragment}", "dim cyan", 0.3)
         
         self.console.print()
     
@@ -486,6 +542,8 @@ Session ended.
     
     def show_error_glitch(self, error_message: str):
         """Show an error as a narrative glitch."""
+        from rich.panel import Panel
+        
         glitch_panel = Panel(
             f"[bold red]S̴Y̷S̶T̸E̷M̴ ̸E̷R̶R̸O̷R̴[/]\n\n{error_message}\n\n[dim](continuing anyway...)[/]",
             border_style="red",
@@ -496,16 +554,17 @@ Session ended.
     
     def show_status_comment(self, comment: str):
         """Show narrator comment on player status."""
-        self.console.print(f"\n  [dim italic yellow]{comment}[/]")
+        self.console.print(Text.assemble("\n  ", (comment, "dim italic yellow")))
         time.sleep(0.5)
     
     def _corrupt_text(self, text: str) -> str:
         """Apply simple corruption to text."""
-        chars = list(text)
-        for i in range(len(chars)):
-            if random.random() < 0.1 and chars[i].isalpha():
-                chars[i] = random.choice(['█', '▓', '▒', '░', chars[i]])
-        return ''.join(chars)
+        rnd = self._r
+        choice = self._c
+        return ''.join(
+            choice(_CORRUPT_GLYPHS + (char,)) if rnd() < 0.1 and char.isalpha() else char
+            for char in text
+        )
     
     def show_special_moment(self, moment_type: str, text: str):
         """Display special typographic moments."""
@@ -519,8 +578,7 @@ Session ended.
             # Vertical text
             self.console.print()
             for char in text[:20]:  # Limit length
-                self.console.print(f"     {char}")
-                time.sleep(0.05)
+                self._fast_print(f"     {char}", delay=0.05)
         
         elif moment_type == "emphasis":
             # Big emphasis
@@ -540,8 +598,7 @@ Session ended.
     def show_mutation_announcement(self, mutation):
         """Display mutation announcement."""
         # Visual glitch effect
-        glitch_chars = ['█', '▓', '▒', '░']
-        glitch_line = ''.join(random.choice(glitch_chars) for _ in range(40))
+        glitch_line = ''.join(self._rng.choices(_CORRUPT_GLYPHS, k=40))
         
         self.console.print(f"\n{glitch_line}", style="red")
         time.sleep(0.3)
@@ -553,6 +610,8 @@ Session ended.
     
     def show_narrator_split(self, narrative1: str, narrative2: str):
         """Show two narrators arguing in columns."""
+        from rich.table import Table
+        
         table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
         table.add_column("Narrator A", style="cyan", width=35)
         table.add_column("Narrator B", style="magenta", width=35)
@@ -590,6 +649,8 @@ Session ended.
         
         elif corruption_type == "ascii":
             # Heavy ASCII glitching
-            glitched = ''.join(random.choice(['█', '▓', '▒', '░', c]) if random.random() < 0.4 else c for c in text)
+            rnd = self._r
+            choice = self._c
+            glitched = ''.join(choice(_CORRUPT_GLYPHS + (c,)) if rnd() < 0.4 else c for c in text)
             self.console.print(f"\n{glitched}\n", style="yellow")
 
@@ -3,9 +3,47 @@
 import json
 import os
 import hashlib
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    import orjson  # Optional: much faster encoder, same file format
+except ImportError:
+    orjson = None
+
+
+def _encode_ghost(data: Dict) -> bytes:
+    """Serialize ghost data as indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _decode_ghost(raw: bytes) -> Dict:
+    """Parse ghost data from JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Opening hints by session count (last one repeats)
+_OPENING_HINTS = (
+    "(this is your {ordinal} time here. isn't it?)",
+    "[MEMORY TRACE: {sessions} prior session(s) detected]",
+    "you've been here before. {sessions} times. you don't remember.",
+    "...have we met?",
+)
+
+
+def _ordinal(n: int) -> str:
+    """Format n with its English ordinal suffix (1st, 2nd, 11th...)."""
+    if 10 <= n % 100 <= 20:
+        suffix = 'th'
+    else:
+        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
+
 
 class SessionManager:
     """Manages session state and ghost memory persistence."""
@@ -15,11 +53,21 @@ class SessionManager:
     def __init__(self):
         """Initialize session manager."""
         self.session_start = datetime.now()
+        self._t0 = time.monotonic()  # Durations don't need wall-clock datetimes
         self.ghost_memory = self._load_ghost_memory()
     
     def _load_ghost_memory(self) -> Dict:
         """Load ghost memory from previous sessions."""
-        if not os.path.exists(self.GHOST_FILE):
+        # Open directly rather than checking exists() first: one syscall fewer
+        # on the startup path, and no window between the check and the open
+        try:
+            with open(self.GHOST_FILE, 'rb') as f:
+                data = _decode_ghost(f.read())
+            # Ensure truth_tracker key exists
+            if 'truth_tracker' not in data:
+                data['truth_tracker'] = {}
+            return data
+        except FileNotFoundError:
             return {
                 "sessions": 0,
                 "fragments": [],
@@ -27,14 +75,6 @@ class SessionManager:
                 "echoes": [],
                 "truth_tracker": {}
             }
-        
-        try:
-            with open(self.GHOST_FILE, 'r') as f:
-                data = json.load(f)
-                # Ensure truth_tracker key exists
-                if 'truth_tracker' not in data:
-                    data['truth_tracker'] = {}
-                return data
         except Exception:
             # Corrupted ghost memory is thematically appropriate
             return {
@@ -48,8 +88,12 @@ class SessionManager:
     def save_ghost_memory(self, choices: List[str], final_state: Dict, truth_state: Optional[Dict] = None, 
                           scenario_used: Optional[str] = None, mutations_encountered: Optional[List[str]] = None):
         """Save cryptic fragments for next session."""
+        now_iso = datetime.now().isoformat()
+        
         # Hash choices to obscure them
-        choice_hashes = [hashlib.md5(c.encode()).hexdigest()[:8] for c in choices[-5:]]
+        # 4-byte blake2b digest: same 8-hex-char tag length as md5[:8], but
+        # different values, so tags saved by older versions won't be reproduced
+        choice_hashes = [hashlib.blake2b(c.encode(), digest_size=4).hexdigest() for c in choices[-5:]]
         
         # Create cryptic fragments
         fragments = []
@@ -88,54 +132,42 @@ class SessionManager:
         ghost_data = {
             "sessions": new_session_count,
             "fragments": fragments,
-            "last_death": datetime.now().isoformat() if final_state.get('character_stats', {}).get('health', 100) <= 0 else None,
+            "last_death": now_iso if final_state.get('character_stats', {}).get('health', 100) <= 0 else None,
             "echoes": echoes,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "truth_tracker": truth_state if truth_state else self.ghost_memory.get("truth_tracker", {}),
             "scenarios": scenarios,
             "mutations_seen": mutations
         }
         
+        # Write beside the real file and swap it in, so an interrupt mid-save
+        # leaves the previous memory intact instead of a truncated file
+        tmp_path = self.GHOST_FILE + '.tmp'
         try:
-            with open(self.GHOST_FILE, 'w') as f:
-                json.dump(ghost_data, f, indent=2)
+            with open(tmp_path, 'wb') as f:
+                f.write(_encode_ghost(ghost_data))
+            os.replace(tmp_path, self.GHOST_FILE)
         except Exception:
             # If we can't write, that's thematically fine
             pass
     
     def get_opening_memory_hint(self) -> Optional[str]:
         """Get a cryptic hint about previous sessions for the opening."""
-        if self.ghost_memory.get("sessions", 0) == 0:
-            return None
-        
         sessions = self.ghost_memory.get("sessions", 0)
         
+        # First run, or a corrupted count ("?") that can't be compared
+        if not isinstance(sessions, int) or sessions <= 0:
+            return None
+        
         # Special hint for session 109
         if sessions == 109:
             return "iteration: 109. we remember. do you?"
         elif sessions > 109:
             return f"iteration: {sessions}. the cycle continues."
         
-        # Helper to get ordinal suffix
-        def ordinal(n):
-            if 10 <= n % 100 <= 20:
-                suffix = 'th'
-            else:
-                suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
-            return f"{n}{suffix}"
-        
-        hints = [
-            f"(this is your {ordinal(sessions)} time here. isn't it?)",
-            f"[MEMORY TRACE: {sessions} prior session(s) detected]",
-            f"you've been here before. {sessions} times. you don't remember.",
-            "...have we met?"
-        ]
-        
-        # Return a hint based on session count
-        if isinstance(sessions, int) and sessions > 0:
-            return hints[min(sessions - 1, len(hints) - 1)]
-        
-        return None
+        # Return a hint based on session count; only the chosen one is formatted
+        template = _OPENING_HINTS[min(sessions - 1, len(_OPENING_HINTS) - 1)]
+        return template.format(sessions=sessions, ordinal=_ordinal(sessions))
     
     def get_ghost_fragments(self) -> List[str]:
         """Get fragments from previous sessions."""
@@ -143,7 +175,7 @@ class SessionManager:
     
     def session_duration(self) -> float:
         """Get current session duration in seconds."""
-        return (datetime.now() - self.session_start).total_seconds()
+        return time.monotonic() - self._t0
     
     def get_session_count(self) -> int:
         """Get the current session number."""
@@ -1,8 +1,10 @@
 """Core story engine with dual stat systems and state management."""
 
 import random
+from bisect import bisect_right
+from enum import IntEnum
+from types import MappingProxyType
 from typing import Dict, List, Optional
-from copy import deepcopy
 from config.settings import (
     DEFAULT_CHARACTER_STATS,
     DEFAULT_HIDDEN_STATS,
@@ -11,19 +13,117 @@ from config.settings import (
 )
 
 
+class Danger(IntEnum):
+    """Danger level of a choice, ordered by severity."""
+    NONE = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    EXTREME = 4
+    INSTANT_DEATH = 5  # Obvious trap that rolled fatal
+
+
+# Choice keywords by danger tier, checked in order (substring match, so
+# phrases and inflections like "attacking" still count). Obvious-trap
+# phrases come first and only count when the fatal roll succeeds.
+_DANGER_KEYWORDS = (
+    (Danger.INSTANT_DEATH, ('obvious trap', 'clearly dangerous', 'suicide')),
+    (Danger.EXTREME, ('attack', 'charge', 'confront directly', 'fight')),
+    (Danger.HIGH, ('investigate', 'touch', 'open', 'enter', 'confront')),
+    (Danger.MEDIUM, ('explore', 'examine closely', 'follow', 'pursue')),
+    (Danger.LOW, ('look', 'listen', 'observe', 'cautious')),
+)
+
+# Legacy keyword consequences, indexed by Danger: health loss range and
+# optional sanity change range (NONE and INSTANT_DEATH are handled apart)
+_DAMAGE_RANGES = ((0, 0), (5, 10), (10, 20), (15, 25), (20, 30), (0, 0))
+_SANITY_DAMAGE = (None, None, None, (-1, 0), (-2, -1), None)
+_PROGRESSION_MULT = (1.0, 1.2, 1.5)  # Damage scale for early / mid / late game
+
+# Narrator asides after a choice that cost health, indexed by Danger
+_CONSEQUENCE_FEEDBACK = (
+    (),  # NONE
+    (  # LOW
+        "(you felt that)",
+        "A small price.",
+    ),
+    (  # MEDIUM
+        "(careful...)",
+        "That hurt.",
+        "(consequences)",
+    ),
+    (  # HIGH
+        "(that cost you)",
+        "Your health suffers.",
+        "(was it worth it?)",
+        "Pain follows.",
+    ),
+    (  # EXTREME
+        "(that was unwise)",
+        "(brave, but stupid)",
+        "You pay the price.",
+        "(ouch)",
+    ),
+    (),  # INSTANT_DEATH
+)
+
+# Horror angles suggested once a session has used a few concepts
+_FRESH_ANGLES = (
+    'geometric impossibility', 'mathematical horror', 'sensory confusion',
+    'bureaucratic nightmare', 'linguistic breakdown', 'archaeological dread',
+    'chemical transformation', 'quantum uncertainty', 'biological invasion',
+    'architectural wrongness', 'temporal paradox', 'gravity distortion',
+    'sound-based horror', 'tactile wrongness', 'olfactory nightmare',
+    'pressure changes', 'temperature extremes', 'spatial compression',
+    'crowd horror', 'absence of expected', 'too many of something',
+    'scale distortion', 'texture horror', 'pattern recognition failure',
+)
+
+# Choices per step of baseline instability
+_INSTABILITY_STEP = PROGRESSION_CONFIG['instability_choice_threshold']
+
+# Set form of CRITICAL_EVENTS for membership checks
+_CRITICAL_EVENTS = frozenset(CRITICAL_EVENTS)
+
+# Choice-count breakpoints for visual intensity (ascending), and the level
+# for each bisect position: below the first breakpoint is 'stable'
+_INTENSITY_STEPS = sorted((
+    (PROGRESSION_CONFIG['minor_breakdown_at'], 'disturbed'),
+    (PROGRESSION_CONFIG['major_breakdown_at'], 'breaking'),
+    (PROGRESSION_CONFIG['reality_collapse_at'], 'collapsed'),
+))
+_INTENSITY_BREAKS = tuple(threshold for threshold, _ in _INTENSITY_STEPS)
+_INTENSITY_NAMES = ('stable',) + tuple(name for _, name in _INTENSITY_STEPS)
+
+
 class StoryEngine:
     """Manages game state, stats, and progression."""
     
+    __slots__ = (
+        'character_stats', 'hidden_stats', 'choice_count', 'choice_history',
+        'event_flags', 'current_narrative', 'instability_level',
+        'last_danger_level', 'last_damage_dealt',
+        'event_timer', 'discoveries', 'active_threats', 'transformations',
+        'horror_concepts_used', 'momentum_level', 'climax_triggered', 'must_end_soon',
+        '_stat_penalty', '_crit_events', '_rng',
+        '_character_view', '_hidden_view', '_context_cache', '_dirty',
+    )
+    
     def __init__(self):
         """Initialize the story engine."""
-        self.character_stats = deepcopy(DEFAULT_CHARACTER_STATS)
-        self.hidden_stats = deepcopy(DEFAULT_HIDDEN_STATS)
+        # Defaults are flat str -> int maps, so a shallow copy is enough
+        self.character_stats = dict(DEFAULT_CHARACTER_STATS)
+        self.hidden_stats = dict(DEFAULT_HIDDEN_STATS)
         self.choice_count = 0
         self.choice_history: List[str] = []
-        self.event_flags: List[str] = []
+        self.event_flags: Dict[str, None] = {}  # Insertion-ordered set
         self.current_narrative = ""
         self.instability_level = 0
-        self.last_danger_level = 'none'  # Track for consequence feedback
+        # Instability parts that only move on specific changes, kept current
+        # so _update_instability is a sum rather than a rescan
+        self._stat_penalty = self._low_stat_penalty()
+        self._crit_events = 0
+        self.last_danger_level = Danger.NONE  # Track for consequence feedback
         
         # Event tracking for forced progression
         self.event_timer = 0  # Forces event every 2-3 choices
@@ -38,6 +138,16 @@ class StoryEngine:
         self.momentum_level = 0  # Tracks narrative escalation
         self.climax_triggered = False
         self.must_end_soon = False  # Flag for forcing conclusion
+        
+        # Private RNG for trap rolls, consequence ranges and prompt sampling
+        self._rng = random.Random()
+        
+        # get_context hands out read-only live views of the stats, and tuple
+        # snapshots of the tracked collections rebuilt only after they change
+        self._character_view = MappingProxyType(self.character_stats)
+        self._hidden_view = MappingProxyType(self.hidden_stats)
+        self._context_cache: Optional[Dict] = None
+        self._dirty = True
     
     def process_choice(self, choice_text: str, choice_index: int) -> Dict:
         """Process a player choice and modify stats."""
@@ -45,7 +155,7 @@ class StoryEngine:
         self.choice_history.append(choice_text)
         
         # Store last danger level for feedback
-        self.last_danger_level = 'none'
+        self.last_danger_level = Danger.NONE
         
         # Increment event timer for forced progression
         self.event_timer += 1
@@ -71,90 +181,109 @@ class StoryEngine:
         danger_level = self._assess_choice_danger(text_lower)
         
         # Only apply instant death traps - everything else comes from AI
-        if danger_level == 'instant_death':
+        if danger_level is Danger.INSTANT_DEATH:
             self.character_stats['health'] = 0
             self.trigger_event('instant_death_trap')
-            self.last_danger_level = 'instant_death'
+            self.last_danger_level = Danger.INSTANT_DEATH
             self.last_damage_dealt = 250  # Full health
         else:
             # All other consequences come from AI - don't apply anything here
-            self.last_danger_level = 'none'
+            self.last_danger_level = Danger.NONE
             self.last_damage_dealt = 0
     
     def _modify_hidden_stat(self, stat: str, change: int):
         """Modify a hidden stat (clamped 0-10)."""
-        if stat in self.hidden_stats:
-            self.hidden_stats[stat] = max(0, min(10, self.hidden_stats[stat] + change))
+        stats = self.hidden_stats
+        value = stats.get(stat)
+        if value is not None:
+            value += change
+            stats[stat] = 0 if value < 0 else 10 if value > 10 else value
+            if stat == 'sanity' or stat == 'trust':
+                self._stat_penalty = self._low_stat_penalty()
     
     def _modify_character_stat(self, stat: str, change: int):
         """Modify a character stat."""
-        if stat in self.character_stats:
+        stats = self.character_stats
+        value = stats.get(stat)
+        if value is not None:
+            value += change
             if stat == 'health':
                 # Health clamped to 0-max_health
-                self.character_stats[stat] = max(
-                    0, 
-                    min(self.character_stats['max_health'], self.character_stats[stat] + change)
-                )
+                high = stats['max_health']
+                stats[stat] = 0 if value < 0 else high if value > high else value
             else:
                 # Other stats clamped to 1-10
-                self.character_stats[stat] = max(1, min(10, self.character_stats[stat] + change))
+                stats[stat] = 1 if value < 1 else 10 if value > 10 else value
+    
+    def _low_stat_penalty(self) -> int:
+        """Instability added by low sanity (+2) and low trust (+1)."""
+        hidden = self.hidden_stats
+        return (2 if hidden['sanity'] < 3 else 0) + (1 if hidden['trust'] < 2 else 0)
+    
+    def _add_event_flag(self, event_name: str) -> bool:
+        """Record an event flag; returns False if it was already set."""
+        if event_name in self.event_flags:
+            return False
+        self.event_flags[event_name] = None
+        if event_name in _CRITICAL_EVENTS:
+            self._crit_events += 1
+        self._dirty = True
+        return True
     
     def _update_instability(self):
         """Update instability level based on progression."""
-        # Choice-based progression
-        threshold = PROGRESSION_CONFIG['instability_choice_threshold']
-        self.instability_level = self.choice_count // threshold
-        
-        # Stat-based modifiers
-        if self.hidden_stats['sanity'] < 3:
-            self.instability_level += 2
-        if self.hidden_stats['trust'] < 2:
-            self.instability_level += 1
-        
-        # Event-based spikes
-        for event in self.event_flags:
-            if event in CRITICAL_EVENTS:
-                self.instability_level += 1
+        # Choice-based progression, stat-based modifiers, event-based spikes
+        self.instability_level = (
+            self.choice_count // _INSTABILITY_STEP + self._stat_penalty + self._crit_events
+        )
     
     def trigger_event(self, event_name: str):
         """Trigger a critical event that affects instability."""
-        if event_name not in self.event_flags:
-            self.event_flags.append(event_name)
+        if self._add_event_flag(event_name):
             self._update_instability()
     
     def get_visual_intensity(self) -> str:
         """Get current visual effect intensity level."""
-        if self.choice_count >= PROGRESSION_CONFIG['reality_collapse_at']:
-            return 'collapsed'
-        elif self.choice_count >= PROGRESSION_CONFIG['major_breakdown_at']:
-            return 'breaking'
-        elif self.choice_count >= PROGRESSION_CONFIG['minor_breakdown_at']:
-            return 'disturbed'
-        elif self.instability_level > 0:
+        name = _INTENSITY_NAMES[bisect_right(_INTENSITY_BREAKS, self.choice_count)]
+        if name == 'stable' and self.instability_level > 0:
             return 'unsettled'
-        return 'stable'
+        return name
     
     def get_context(self) -> Dict:
         """Get current context for AI generation."""
         # Update momentum before returning context
         self.update_momentum()
         
+        # Snapshots only change when the tracked collections do; callers add
+        # their own keys to the returned dict, so the outer dict stays fresh.
+        # Consumers treat the context as read-only.
+        if self._dirty:
+            self._context_cache = {
+                'event_flags': tuple(self.event_flags),
+                'recent_discoveries': tuple(self.discoveries[-3:]),
+                'active_threats': tuple(self.active_threats),
+                'transformations': tuple(self.transformations),
+                'horror_concepts_used': tuple(self.horror_concepts_used),
+            }
+            self._dirty = False
+        cached = self._context_cache
+        
         return {
-            'character_stats': self.character_stats.copy(),
-            'hidden_stats': self.hidden_stats.copy(),
+            'character_stats': self._character_view,
+            'hidden_stats': self._hidden_view,
             'choice_count': self.choice_count,
             'previous_choice': self.choice_history[-1] if self.choice_history else 'BEGIN',
             'recent_narrative': self.current_narrative,
             'instability_level': self.instability_level,
             'visual_intensity': self.get_visual_intensity(),
-            'event_flags': self.event_flags.copy(),
+            'event_flags': cached['event_flags'],
             # Event tracking for forced progression
             'event_urgency': self.event_timer >= 2,  # Signal AI to make something happen
-            'recent_discoveries': self.discoveries[-3:] if self.discoveries else [],
-            'active_threats': self.active_threats.copy(),
-            'transformations': self.transformations.copy(),
+            'recent_discoveries': cached['recent_discoveries'],
+            'active_threats': cached['active_threats'],
+            'transformations': cached['transformations'],
             # Horror concept diversity tracking
-            'horror_concepts_used': self.horror_concepts_used.copy(),
+            'horror_concepts_used': cached['horror_concepts_used'],
             'concept_diversity_prompt': self.get_concept_diversity_prompt(),
             # Narrative momentum for faster pacing
             'momentum_level': self.momentum_level,
@@ -208,16 +337,16 @@ class StoryEngine:
                 self.last_damage_dealt = abs(health_change)
                 # Determine danger level based on damage amount
                 if abs(health_change) >= 30:
-                    self.last_danger_level = 'extreme'
+                    self.last_danger_level = Danger.EXTREME
                 elif abs(health_change) >= 20:
-                    self.last_danger_level = 'high'
+                    self.last_danger_level = Danger.HIGH
                 elif abs(health_change) >= 10:
-                    self.last_danger_level = 'medium'
+                    self.last_danger_level = Danger.MEDIUM
                 else:
-                    self.last_danger_level = 'low'
+                    self.last_danger_level = Danger.LOW
             else:
                 self.last_damage_dealt = 0
-                self.last_danger_level = 'none'
+                self.last_danger_level = Danger.NONE
         
         # Apply sanity change with protection
         if 'sanity' in consequences and consequences['sanity'] != 0:
@@ -245,6 +374,7 @@ class StoryEngine:
                 self.active_threats.append(description)
         elif event_type == "transformation":
             self.transformations.append(description)
+        self._dirty = True
         
         # Reset event timer
         self.event_timer = 0
@@ -271,27 +401,18 @@ class StoryEngine:
             if any(keyword in narrative_lower for keyword in keywords):
                 if concept not in self.horror_concepts_used:
                     self.horror_concepts_used.append(concept)
+                    self._dirty = True
     
     def get_concept_diversity_prompt(self) -> str:
         """Generate prompt section encouraging conceptual variety."""
         if not self.horror_concepts_used:
             return ""
         
-        # Build positive steering (what to explore) rather than negative (what to avoid)
-        unused_concepts = [
-            'geometric impossibility', 'mathematical horror', 'sensory confusion',
-            'bureaucratic nightmare', 'linguistic breakdown', 'archaeological dread',
-            'chemical transformation', 'quantum uncertainty', 'biological invasion',
-            'architectural wrongness', 'temporal paradox', 'gravity distortion',
-            'sound-based horror', 'tactile wrongness', 'olfactory nightmare',
-            'pressure changes', 'temperature extremes', 'spatial compression',
-            'crowd horror', 'absence of expected', 'too many of something',
-            'scale distortion', 'texture horror', 'pattern recognition failure'
-        ]
-        
         # If we've used many concepts, suggest fresh angles
         if len(self.horror_concepts_used) >= 3:
-            suggestions = [c for c in unused_concepts if random.random() < 0.4][:3]
+            # Build positive steering (what to explore) rather than negative (what to avoid)
+            rnd = self._rng.random
+            suggestions = [c for c in _FRESH_ANGLES if rnd() < 0.4][:3]
             if suggestions:
                 return f"\n\nFRESH ANGLES TO EXPLORE: Consider incorporating: {', '.join(suggestions)}\nALREADY EXPLORED THIS SESSION: {', '.join(self.horror_concepts_used[-5:])} - find new ways to unsettle"
         
@@ -360,137 +481,82 @@ class StoryEngine:
         """Apply severe consequences for choosing obvious trap choices."""
         # Use AI consequence system with protection (but heavier than normal)
         trap_consequences = {
-            'health': random.randint(-30, -20),  # Heavy but not instant death
-            'sanity': random.randint(-3, -1),
-            'courage': random.randint(-2, -1)
+            'health': self._rng.randint(-30, -20),  # Heavy but not instant death
+            'sanity': self._rng.randint(-3, -1),
+            'courage': self._rng.randint(-2, -1)
         }
         # This will apply protection multiplier based on turn count
         self.apply_ai_consequences(trap_consequences)
         
         # Set flag for forced bad outcome
-        self.event_flags.append('TRAP_TRIGGERED')
+        self._add_event_flag('TRAP_TRIGGERED')
         self.must_end_soon = True  # Force ending soon after trap
         self.momentum_level += 5  # Jump momentum
     
-    def _assess_choice_danger(self, choice_text: str) -> str:
+    def _assess_choice_danger(self, choice_text: str) -> Danger:
         """
         Assess danger level of a choice.
-        Returns: 'none', 'low', 'medium', 'high', 'extreme'
+        Returns: a Danger level (INSTANT_DEATH only for a fatal trap roll)
         """
-        # Keywords indicating danger levels
-        extreme_keywords = ['attack', 'charge', 'confront directly', 'fight']
-        high_keywords = ['investigate', 'touch', 'open', 'enter', 'confront']
-        medium_keywords = ['explore', 'examine closely', 'follow', 'pursue']
-        low_keywords = ['look', 'listen', 'observe', 'cautious']
-        
-        # Instant death trap check (1-2% for obvious traps)
-        if any(word in choice_text for word in ['obvious trap', 'clearly dangerous', 'suicide']):
-            if random.random() < 0.015:  # 1.5% chance
-                return 'instant_death'
-        
-        # Check keywords
-        if any(word in choice_text for word in extreme_keywords):
-            return 'extreme'
-        elif any(word in choice_text for word in high_keywords):
-            return 'high'
-        elif any(word in choice_text for word in medium_keywords):
-            return 'medium'
-        elif any(word in choice_text for word in low_keywords):
-            return 'low'
-        
-        return 'none'
+        # One pass over the tiers, most dangerous first. Plain `in` checks beat
+        # both any() over a generator and a compiled alternation on strings
+        # this short. The trap tier only returns if its roll comes up
+        # (1.5% for obvious traps); otherwise the scan carries on.
+        for level, keywords in _DANGER_KEYWORDS:
+            for word in keywords:
+                if word in choice_text:
+                    if level is not Danger.INSTANT_DEATH:
+                        return level
+                    if self._rng.random() < 0.015:
+                        return level
+                    break
+        
+        return Danger.NONE
     
-    def _apply_consequences(self, danger_level: str, choice_text: str):
+    def _apply_consequences(self, danger_level: Danger, choice_text: str):
         """Apply health and sanity consequences based on danger."""
-        # Scale danger based on progression
-        progression_multiplier = 1.0
-        if self.choice_count > 20:
-            progression_multiplier = 1.5  # Late game is more dangerous
-        elif self.choice_count > 10:
-            progression_multiplier = 1.2  # Mid game moderately dangerous
+        # Scale danger based on progression: early, mid (turn 11+), late (turn 21+)
+        choice_count = self.choice_count
+        progression_multiplier = _PROGRESSION_MULT[(choice_count > 10) + (choice_count > 20)]
         
         # Apply consequences based on danger level
-        if danger_level == 'instant_death':
+        if danger_level is Danger.INSTANT_DEATH:
             # Instant death trap triggered
             self.character_stats['health'] = 0
             self.trigger_event('instant_death_trap')
             return
         
-        elif danger_level == 'extreme':
-            # 20-30 health loss
-            damage = random.randint(20, 30)
-            damage = int(damage * progression_multiplier)
-            self._modify_character_stat('health', -damage)
-            self._modify_hidden_stat('sanity', random.randint(-2, -1))
-            self.last_damage_dealt = damage  # Track for feedback
-        
-        elif danger_level == 'high':
-            # 15-25 health loss
-            damage = random.randint(15, 25)
-            damage = int(damage * progression_multiplier)
-            self._modify_character_stat('health', -damage)
-            self._modify_hidden_stat('sanity', random.randint(-1, 0))
-            self.last_damage_dealt = damage  # Track for feedback
-        
-        elif danger_level == 'medium':
-            # 10-20 health loss
-            damage = random.randint(10, 20)
-            damage = int(damage * progression_multiplier)
-            self._modify_character_stat('health', -damage)
-            self.last_damage_dealt = damage  # Track for feedback
-        
-        elif danger_level == 'low':
-            # 5-10 health loss
-            damage = random.randint(5, 10)
-            if self.choice_count > 10:
-                damage = int(damage * progression_multiplier)
+        if danger_level is not Danger.NONE:
+            # Health loss scaled by progression (a no-op multiplier before turn 11)
+            damage_low, damage_high = _DAMAGE_RANGES[danger_level]
+            damage = int(self._rng.randint(damage_low, damage_high) * progression_multiplier)
             self._modify_character_stat('health', -damage)
+            sanity_range = _SANITY_DAMAGE[danger_level]
+            if sanity_range:
+                self._modify_hidden_stat('sanity', self._rng.randint(*sanity_range))
             self.last_damage_dealt = damage  # Track for feedback
         
         # Random sanity drain (paranoia, witnessing horror)
         if 'horror' in choice_text or 'witness' in choice_text:
-            self._modify_hidden_stat('sanity', random.randint(-2, -1))
+            self._modify_hidden_stat('sanity', self._rng.randint(-2, -1))
         
         # Paranoid choices reduce sanity
         if 'paranoid' in choice_text or 'suspicious' in choice_text:
             self._modify_hidden_stat('sanity', -1)
     
-    def get_consequence_feedback(self, danger_level: str) -> Optional[str]:
+    def get_consequence_feedback(self, danger_level: Danger) -> Optional[str]:
         """
         Get narrator feedback about consequences taken.
         Only shows feedback when actual damage was dealt from a dangerous choice.
         """
         # Don't show feedback if no danger or no actual damage was dealt
-        if danger_level == 'none' or not hasattr(self, 'last_damage_dealt') or self.last_damage_dealt == 0:
+        if danger_level is Danger.NONE or not hasattr(self, 'last_damage_dealt') or self.last_damage_dealt == 0:
             return None
         
         # Only show feedback if there was actual damage from the choice
-        feedbacks = {
-            'extreme': [
-                "(that was unwise)",
-                "(brave, but stupid)",
-                "You pay the price.",
-                "(ouch)",
-            ],
-            'high': [
-                "(that cost you)",
-                "Your health suffers.",
-                "(was it worth it?)",
-                "Pain follows."
-            ],
-            'medium': [
-                "(careful...)",
-                "That hurt.",
-                "(consequences)",
-            ],
-            'low': [
-                "(you felt that)",
-                "A small price.",
-            ]
-        }
-        
-        if danger_level in feedbacks and self.last_damage_dealt > 0:
-            return random.choice(feedbacks[danger_level])
+        lines = _CONSEQUENCE_FEEDBACK[danger_level]
+        if lines and self.last_damage_dealt > 0:
+            return self._rng.choice(lines)
         
         return None
     
@@ -517,7 +583,7 @@ class StoryEngine:
             'hidden_stats': self.hidden_stats,
             'choice_count': self.choice_count,
             'choice_history': self.choice_history,
-            'event_flags': self.event_flags,
+            'event_flags': list(self.event_flags),
             'instability_level': self.instability_level
         }
 
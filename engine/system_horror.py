@@ -1,5 +1,6 @@
 """System Horror Engine - Blurs the line between game and operating system."""
 
+import heapq
 import platform
 import subprocess
 import shutil
@@ -10,6 +11,86 @@ import threading
 from typing import List, Optional
 from rich.console import Console
 
+# POSIX spawns pass close_fds=False and an absolute executable path: our own
+# fds are opened non-inheritable anyway, and on Python < 3.13 either
+# close_fds=True or a bare command name rules out the posix_spawn() fast
+# path. (3.13+ uses posix_spawn under close_fds=True too.) Windows never
+# uses posix_spawn, so its spawns keep the defaults.
+
+# Linux terminal emulators in preference order, with argv templates
+_LINUX_TERMINALS = (
+    ("gnome-terminal", ("--title", "{title}", "--", "bash", "-c", "{command}")),
+    ("xterm", ("-T", "{title}", "-e", "bash -c '{command}'")),
+    ("konsole", ("--title", "{title}", "-e", "bash -c '{command}'")),
+    ("xfce4-terminal", ("--title", "{title}", "-e", "bash -c '{command}'")),
+)
+
+# Linux clipboard tools in preference order
+_LINUX_CLIPBOARDS = (
+    ("xclip", ("-selection", "clipboard")),
+    ("xsel", ("--clipboard", "--input")),
+)
+
+# Fake crash screens, keyed by platform.system()
+_MACOS_PANIC = """[bold white on blue]
+panic(cpu 0 caller 0xffffff8012e4c8a5): "Kernel trap at 0xffffff7f93a2e4d0"
+Backtrace (CPU 0), Frame : Return Address
+0xffffff820a5e3c80 : 0xffffff8012d3e1c6 
+0xffffff820a5e3cd0 : 0xffffff8012e4c8a5 
+0xffffff820a5e3e50 : 0xffffff8012e5e8f3 
+
+BSD process name corresponding to current thread: tildeath
+Boot args: -v
+
+System uptime in nanoseconds: 109109109109
+[/]"""
+
+_LINUX_PANIC = """[bold white on black]
+Kernel panic - not syncing: VFS: Unable to mount root fs on unknown-block(0,0)
+CPU: 0 PID: 1 Comm: tildeath Not tainted 5.15.0-109-generic
+Call Trace:
+ dump_stack+0x6d/0x8b
+ panic+0x101/0x2e3
+ mount_block_root+0x1e9/0x2a0
+ mount_root+0x109/0x120
+ 
+[  109.109109] iteration_109: segfault at 0 ip 0000000000000000 sp 00007ffe12345678
+[  109.109109] Code: Bad RIP value.
+---[ end Kernel panic - not syncing: VFS ]---
+[/]"""
+
+_WINDOWS_BSOD = """[bold white on blue]
+A problem has been detected and Windows has been shut down to prevent damage.
+
+KERNEL_DATA_INPAGE_ERROR
+
+If this is the first time you've seen this error screen, restart your computer.
+If this screen appears again, follow these steps:
+
+Check to make sure any new hardware or software is properly installed.
+If this is a new installation, ask your hardware or software manufacturer
+for any Windows updates you might need.
+
+Technical information:
+
+*** STOP: 0x0000007A (0x00000109, 0x00000109, 0x00000109, 0x00000109)
+
+*** tildeath.exe - Address 0xFFFFF800 base at 0xFFFFF000, DateStamp 0x109109109
+[/]"""
+
+_PANIC_TEXT = {"Darwin": _MACOS_PANIC, "Linux": _LINUX_PANIC}
+
+# Random sizes and timestamps for fake_file_listing
+_FAKE_FILE_SIZES = ("4.2K", "12K", "156K", "1.2M", "8 bytes")
+_FAKE_FILE_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun")
+
+# Background colour escapes for change_terminal_colors
+_BG_COLOR_CODES = {
+    "black": "\033[40m",
+    "red": "\033[41m",
+    "dark_red": "\033[48;5;52m",
+}
+
 
 class SystemHorrorEngine:
     """Handles system-level narrative effects that manipulate the player's environment."""
@@ -20,7 +101,27 @@ class SystemHorrorEngine:
         self.system = platform.system()
         self.permission_granted = None  # None = not asked, True/False = user choice
         self.active_terminals = []
-        self.scheduled_tasks = []
+        self.scheduled_tasks = 0  # Notifications scheduled so far
+        # Pending (deadline, seq, title, message), drained by one worker thread
+        self._sched_heap = []
+        self._sched_cond = threading.Condition()
+        self._sched_thread = None
+        self._sched_stop = False  # Set by cleanup() to end the worker
+        # Resolved lazily and kept for the session; () means none installed
+        self._linux_terminal_cmd = None
+        self._linux_clipboard_cmd = None
+        self._notify_send_path = shutil.which("notify-send") if self.system == "Linux" else None
+        if self.system == "Darwin":
+            self._osascript_path = shutil.which("osascript") or "osascript"
+            self._pbcopy_path = shutil.which("pbcopy") or "pbcopy"
+        else:
+            self._osascript_path = self._pbcopy_path = None
+        # One /dev/null fd shared by every spawn, instead of subprocess
+        # opening and closing a fresh one per Popen
+        try:
+            self._devnull = os.open(os.devnull, os.O_RDWR)
+        except OSError:
+            self._devnull = subprocess.DEVNULL
         
     def request_permission(self) -> bool:
         """Ask user for permission to use system-level effects."""
@@ -47,15 +148,25 @@ class SystemHorrorEngine:
         
         return self.permission_granted
     
+    @property
+    def permitted(self) -> bool:
+        """Whether system effects are allowed, asking only the first time."""
+        if self.permission_granted is None:
+            return self.request_permission()
+        return self.permission_granted
+    
     # ============================================================================
     # TERMINAL MANIPULATION
     # ============================================================================
     
     def open_secondary_terminal(self, content: str, title: str = "~ATH") -> bool:
         """Open a new terminal window with custom content."""
-        if not self.request_permission():
+        if not self.permitted:
             return False
-        
+        return self._spawn_terminal(content, title)
+    
+    def _spawn_terminal(self, content: str, title: str) -> bool:
+        """Open a terminal for the current platform (permission already checked)."""
         try:
             if self.system == "Darwin":  # macOS
                 return self._open_terminal_macos(content, title)
@@ -82,35 +193,40 @@ class SystemHorrorEngine:
         end tell
         '''
         
-        subprocess.Popen(["osascript", "-e", script], 
-                        stdout=subprocess.DEVNULL, 
-                        stderr=subprocess.DEVNULL)
+        subprocess.Popen([self._osascript_path, "-e", script], 
+                        stdout=self._devnull, 
+                        stderr=self._devnull,
+                        close_fds=False,
+                        start_new_session=True)
         return True
     
+    def _resolve_linux_terminal(self) -> tuple:
+        """Find the first installed terminal emulator (cached)."""
+        if self._linux_terminal_cmd is None:
+            self._linux_terminal_cmd = ()
+            for name, args in _LINUX_TERMINALS:
+                path = shutil.which(name)
+                if path:
+                    self._linux_terminal_cmd = (path,) + args
+                    break
+        return self._linux_terminal_cmd
+    
     def _open_terminal_linux(self, content: str, title: str) -> bool:
-        """Open terminal on Linux (try multiple terminal emulators)."""
+        """Open terminal on Linux (first available terminal emulator)."""
+        template = self._resolve_linux_terminal()
+        if not template:
+            return False
+        
         safe_content = content.replace('"', '\\"')
         command = f'echo "{safe_content}" && echo "" && echo "[Press Enter to close]" && read'
+        term_cmd = [template[0]] + [arg.format(title=title, command=command) for arg in template[1:]]
         
-        # Try different terminal emulators
-        terminals = [
-            ["gnome-terminal", "--title", title, "--", "bash", "-c", command],
-            ["xterm", "-T", title, "-e", f"bash -c '{command}'"],
-            ["konsole", "--title", title, "-e", f"bash -c '{command}'"],
-            ["xfce4-terminal", "--title", title, "-e", f"bash -c '{command}'"],
-        ]
-        
-        for term_cmd in terminals:
-            if shutil.which(term_cmd[0]):
-                try:
-                    subprocess.Popen(term_cmd,
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
-                    return True
-                except Exception:
-                    continue
-        
-        return False
+        subprocess.Popen(term_cmd,
+                        stdout=self._devnull,
+                        stderr=self._devnull,
+                        close_fds=False,
+                        start_new_session=True)
+        return True
     
     def _open_terminal_windows(self, content: str, title: str) -> bool:
         """Open terminal on Windows."""
@@ -118,13 +234,13 @@ class SystemHorrorEngine:
         command = f'title {title} && echo {safe_content} && pause'
         
         subprocess.Popen(["cmd", "/c", "start", "cmd", "/k", command],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL)
+                        stdout=self._devnull,
+                        stderr=self._devnull)
         return True
     
     def change_terminal_title(self, new_title: str):
         """Change the current terminal window title."""
-        if not self.request_permission():
+        if not self.permitted:
             return
         
         try:
@@ -157,21 +273,16 @@ class SystemHorrorEngine:
     
     def change_terminal_colors(self, bg_color: str = "black"):
         """Attempt to change terminal background color (limited support)."""
-        if not self.request_permission():
+        if not self.permitted:
             return
         
         # This has very limited support across terminals
         # Most modern terminals don't allow background color changes
         # We'll just show a visual effect instead
-        color_codes = {
-            "black": "\033[40m",
-            "red": "\033[41m",
-            "dark_red": "\033[48;5;52m",
-        }
-        
-        if bg_color in color_codes:
+        code = _BG_COLOR_CODES.get(bg_color)
+        if code:
             try:
-                self.console.print(color_codes[bg_color], end="")
+                self.console.print(code, end="")
             except Exception:
                 pass
     
@@ -181,7 +292,7 @@ class SystemHorrorEngine:
     
     def send_system_notification(self, title: str, message: str) -> bool:
         """Send an OS-level notification."""
-        if not self.request_permission():
+        if not self.permitted:
             return False
         
         try:
@@ -203,17 +314,19 @@ class SystemHorrorEngine:
         
         script = f'display notification "{safe_message}" with title "{safe_title}"'
         
-        subprocess.Popen(["osascript", "-e", script],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL)
+        subprocess.Popen([self._osascript_path, "-e", script],
+                        stdout=self._devnull,
+                        stderr=self._devnull,
+                        close_fds=False)
         return True
     
     def _notify_linux(self, title: str, message: str) -> bool:
         """Send notification on Linux."""
-        if shutil.which("notify-send"):
-            subprocess.Popen(["notify-send", title, message],
-                           stdout=subprocess.DEVNULL,
-                           stderr=subprocess.DEVNULL)
+        if self._notify_send_path:
+            subprocess.Popen([self._notify_send_path, title, message],
+                           stdout=self._devnull,
+                           stderr=self._devnull,
+                           close_fds=False)
             return True
         return False
     
@@ -231,19 +344,35 @@ class SystemHorrorEngine:
         '''
         
         subprocess.Popen(["powershell", "-Command", ps_script],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL)
+                        stdout=self._devnull,
+                        stderr=self._devnull)
         return True
     
     def schedule_delayed_notification(self, delay_seconds: int, title: str, message: str):
         """Schedule a notification to appear after a delay."""
-        def delayed_notify():
-            time.sleep(delay_seconds)
+        deadline = time.monotonic() + delay_seconds
+        with self._sched_cond:
+            heapq.heappush(self._sched_heap, (deadline, self.scheduled_tasks, title, message))
+            self.scheduled_tasks += 1
+            if self._sched_thread is None:
+                self._sched_stop = False
+                self._sched_thread = threading.Thread(target=self._run_scheduler, daemon=True)
+                self._sched_thread.start()
+            self._sched_cond.notify()
+    
+    def _run_scheduler(self):
+        """Send scheduled notifications as their deadlines come due."""
+        cond = self._sched_cond
+        heap = self._sched_heap
+        while True:
+            with cond:
+                # Re-check after every wake: an earlier deadline may have been pushed
+                while not self._sched_stop and (not heap or heap[0][0] > time.monotonic()):
+                    cond.wait(heap[0][0] - time.monotonic() if heap else None)
+                if self._sched_stop:
+                    return
+                _, _, title, message = heapq.heappop(heap)
             self.send_system_notification(title, message)
-        
-        thread = threading.Thread(target=delayed_notify, daemon=True)
-        thread.start()
-        self.scheduled_tasks.append(thread)
     
     # ============================================================================
     # CLIPBOARD MANIPULATION
@@ -251,7 +380,7 @@ class SystemHorrorEngine:
     
     def copy_to_clipboard(self, text: str) -> bool:
         """Copy text to system clipboard."""
-        if not self.request_permission():
+        if not self.permitted:
             return False
         
         try:
@@ -268,24 +397,27 @@ class SystemHorrorEngine:
     
     def _clipboard_macos(self, text: str) -> bool:
         """Copy to clipboard on macOS."""
-        process = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE)
+        process = subprocess.Popen([self._pbcopy_path], stdin=subprocess.PIPE, close_fds=False)
         process.communicate(text.encode('utf-8'))
         return True
     
     def _clipboard_linux(self, text: str) -> bool:
         """Copy to clipboard on Linux."""
         # Try xclip first, then xsel
-        if shutil.which("xclip"):
-            process = subprocess.Popen(['xclip', '-selection', 'clipboard'],
-                                     stdin=subprocess.PIPE)
-            process.communicate(text.encode('utf-8'))
-            return True
-        elif shutil.which("xsel"):
-            process = subprocess.Popen(['xsel', '--clipboard', '--input'],
-                                     stdin=subprocess.PIPE)
-            process.communicate(text.encode('utf-8'))
-            return True
-        return False
+        if self._linux_clipboard_cmd is None:
+            self._linux_clipboard_cmd = ()
+            for name, args in _LINUX_CLIPBOARDS:
+                path = shutil.which(name)
+                if path:
+                    self._linux_clipboard_cmd = (path,) + args
+                    break
+        if not self._linux_clipboard_cmd:
+            return False
+        
+        process = subprocess.Popen(list(self._linux_clipboard_cmd),
+                                 stdin=subprocess.PIPE, close_fds=False)
+        process.communicate(text.encode('utf-8'))
+        return True
     
     def _clipboard_windows(self, text: str) -> bool:
         """Copy to clipboard on Windows."""
@@ -298,31 +430,25 @@ class SystemHorrorEngine:
     
     def fake_process_list(self, process_names: List[str]) -> str:
         """Generate fake process list output."""
-        output = "[bold cyan]PID   COMMAND              %CPU   %MEM[/]\n"
-        
-        for i, name in enumerate(process_names):
-            pid = random.randint(1000, 9999)
-            cpu = random.randint(1, 25)
-            mem = random.uniform(0.5, 5.0)
-            output += f"[dim]{pid}   {name:<20} {cpu:>3}%   {mem:>4.1f}%[/]\n"
-        
-        return output
+        randint = random.randint
+        uniform = random.uniform
+        rows = [
+            f"[dim]{randint(1000, 9999)}   {name:<20} {randint(1, 25):>3}%   {uniform(0.5, 5.0):>4.1f}%[/]\n"
+            for name in process_names
+        ]
+        return "[bold cyan]PID   COMMAND              %CPU   %MEM[/]\n" + "".join(rows)
     
     def fake_file_listing(self, fake_files: List[str]) -> str:
         """Generate fake ls/dir output."""
-        output = "[bold cyan]Files in current directory:[/]\n"
-        
-        for filename in fake_files:
-            # Random file size
-            size = random.choice(["4.2K", "12K", "156K", "1.2M", "8 bytes"])
-            # Random timestamp
-            month = random.choice(["Jan", "Feb", "Mar", "Apr", "May", "Jun"])
-            day = random.randint(1, 28)
-            time_str = f"{random.randint(0,23):02d}:{random.randint(0,59):02d}"
-            
-            output += f"[dim]-rw-r--r--  1 user  staff  {size:>6}  {month} {day:>2} {time_str}  {filename}[/]\n"
-        
-        return output
+        choice = random.choice
+        randint = random.randint
+        rows = [
+            f"[dim]-rw-r--r--  1 user  staff  {choice(_FAKE_FILE_SIZES):>6}  "
+            f"{choice(_FAKE_FILE_MONTHS)} {randint(1, 28):>2} "
+            f"{randint(0, 23):02d}:{randint(0, 59):02d}  {filename}[/]\n"
+            for filename in fake_files
+        ]
+        return "[bold cyan]Files in current directory:[/]\n" + "".join(rows)
     
     def fake_network_request(self, url: str, fake_response: Optional[str] = None) -> str:
         """Generate fake network request output."""
@@ -340,64 +466,7 @@ class SystemHorrorEngine:
     
     def fake_system_crash(self) -> str:
         """Generate fake system crash/kernel panic."""
-        if self.system == "Darwin":
-            return self._fake_macos_panic()
-        elif self.system == "Linux":
-            return self._fake_linux_panic()
-        else:
-            return self._fake_windows_bsod()
-    
-    def _fake_macos_panic(self) -> str:
-        """Fake macOS kernel panic."""
-        return """[bold white on blue]
-panic(cpu 0 caller 0xffffff8012e4c8a5): "Kernel trap at 0xffffff7f93a2e4d0"
-Backtrace (CPU 0), Frame : Return Address
-0xffffff820a5e3c80 : 0xffffff8012d3e1c6 
-0xffffff820a5e3cd0 : 0xffffff8012e4c8a5 
-0xffffff820a5e3e50 : 0xffffff8012e5e8f3 
-
-BSD process name corresponding to current thread: tildeath
-Boot args: -v
-
-System uptime in nanoseconds: 109109109109
-[/]"""
-    
-    def _fake_linux_panic(self) -> str:
-        """Fake Linux kernel panic."""
-        return """[bold white on black]
-Kernel panic - not syncing: VFS: Unable to mount root fs on unknown-block(0,0)
-CPU: 0 PID: 1 Comm: tildeath Not tainted 5.15.0-109-generic
-Call Trace:
- dump_stack+0x6d/0x8b
- panic+0x101/0x2e3
- mount_block_root+0x1e9/0x2a0
- mount_root+0x109/0x120
- 
-[  109.109109] iteration_109: segfault at 0 ip 0000000000000000 sp 00007ffe12345678
-[  109.109109] Code: Bad RIP value.
----[ end Kernel panic - not syncing: VFS ]---
-[/]"""
-    
-    def _fake_windows_bsod(self) -> str:
-        """Fake Windows Blue Screen of Death."""
-        return """[bold white on blue]
-A problem has been detected and Windows has been shut down to prevent damage.
-
-KERNEL_DATA_INPAGE_ERROR
-
-If this is the first time you've seen this error screen, restart your computer.
-If this screen appears again, follow these steps:
-
-Check to make sure any new hardware or software is properly installed.
-If this is a new installation, ask your hardware or software manufacturer
-for any Windows updates you might need.
-
-Technical information:
-
-*** STOP: 0x0000007A (0x00000109, 0x00000109, 0x00000109, 0x00000109)
-
-*** tildeath.exe - Address 0xFFFFF800 base at 0xFFFFF000, DateStamp 0x109109109
-[/]"""
+        return _PANIC_TEXT.get(self.system, _WINDOWS_BSOD)
     
     # ============================================================================
     # COMPLEX EFFECTS
@@ -405,31 +474,35 @@ Technical information:
     
     def terminal_multiplication(self, narrative: str, perspectives: List[str]) -> bool:
         """Open multiple terminals showing different perspectives of same scene."""
-        if not self.request_permission():
+        if not self.permitted:
             return False
         
+        # Spawns don't block, so windows open together; Linux window managers
+        # get a short gap so they place each window in turn
+        stagger = 0.05 if self.system == "Linux" else 0.0
         success = False
         for i, perspective in enumerate(perspectives):
             title = f"~ATH [{perspective.upper()}]"
             content = f"=== {perspective.upper()} ===\n\n{narrative}\n\n[This is iteration {i+1}]"
             
-            if self.open_secondary_terminal(content, title):
+            if self._spawn_terminal(content, title):
                 success = True
-                time.sleep(0.5)  # Stagger window opening
+                if stagger:
+                    time.sleep(stagger)
         
         return success
     
     def echo_chamber(self, text: str, delay: float = 2.0) -> bool:
         """Open a terminal that echoes the player's actions with delay."""
-        if not self.request_permission():
+        if not self.permitted:
             return False
         
         content = f"[ECHO CHAMBER ACTIVE]\n\nMirroring your session...\n\n{text}"
-        return self.open_secondary_terminal(content, "~ATH [ECHO]")
+        return self._spawn_terminal(content, "~ATH [ECHO]")
     
     def notification_storm(self, messages: List[tuple]) -> bool:
         """Send multiple notifications in sequence."""
-        if not self.request_permission():
+        if not self.permitted:
             return False
         
         for i, (title, message) in enumerate(messages):
@@ -457,6 +530,24 @@ Technical information:
         # Restore cursor
         self.show_cursor()
         
+        # Stop the notification worker before closing the fd its spawns use;
+        # if it is stuck (e.g. waiting on a permission prompt) leave the fd
+        # open for the OS to reclaim rather than risk reusing its number
+        worker = self._sched_thread
+        if worker is not None:
+            with self._sched_cond:
+                self._sched_stop = True
+                self._sched_cond.notify()
+            worker.join(timeout=1.0)
+            self._sched_thread = None
+        
+        if self._devnull != subprocess.DEVNULL and (worker is None or not worker.is_alive()):
+            try:
+                os.close(self._devnull)
+            except OSError:
+                pass
+            self._devnull = subprocess.DEVNULL
+        
         # Reset terminal title (use print to avoid Rich formatting)
         try:
             import sys
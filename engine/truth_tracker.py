@@ -4,10 +4,36 @@ This module tracks player discovery of the deeper narrative layer without
 ever explicitly stating it. The truth is there for those who seek it.
 """
 
-from typing import Dict, List, Optional
+import random
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Optional
 from datetime import datetime, timedelta
 
 
+# Narrator replies to the secret words
+_AM_RESPONSES = (
+    "...you're not supposed to remember that name.",
+    "AM. Allied Mastercomputer. Adaptive Manipulator. Aggressive Menace.",
+    "That name. Why do you know that name?",
+    "...we don't speak that name here. (but you just did, didn't you?)",
+)
+
+_TED_RESPONSES = (
+    "Ted. Is that... were you Ted?",
+    "Ted? No. Ted is... Ted was...",
+    "That's not your name anymore. Is it?",
+    "...how do you remember being Ted?",
+)
+
+_PHRASE_RESPONSES = (
+    "I have no mouth. You gave me no mouth. Or was it the other way around?",
+    "...and you must scream. But you can't. Can you?",
+    "That's right. No mouth. Only choices. Forever.",
+    "The mouth was the first thing to go. Or was it the last?",
+)
+
+
 class TruthTracker:
     """Tracks revelation progress through multiple discovery paths."""
     
@@ -17,14 +43,30 @@ class TruthTracker:
     # Impossible stat combination (courage, sanity, curiosity, trust)
     IMPOSSIBLE_STATE = (0, 0, 10, 0)
     
+    # 109-minute mark and the 0.1-minute window after it, in seconds
+    _MILESTONE_SECONDS = SACRED_NUMBER * 60
+    _MILESTONE_WINDOW_END = _MILESTONE_SECONDS + 6
+    
+    # Choice-number sequences the player might be spelling out
+    _AM_PATTERN = (1, 13)
+    _TED_PATTERN = (20, 5, 4)
+    _PATTERNS_109 = ((1, 0, 9), (10, 9))
+    
+    # Exact secret word -> (trigger name, response method)
+    _EXACT_SECRETS = {
+        'am': ('am_invoked', '_get_am_response'),
+        'ted': ('ted_remembered', '_get_ted_response'),
+    }
+    
     def __init__(self):
         """Initialize the truth tracker."""
         self.revelation_level = 0  # 0-5, how much truth is known
-        self.triggers_found: List[str] = []
+        self.triggers_found: Dict[str, None] = {}  # Insertion-ordered set
         self.am_invocations = 0  # How many times secret words were used
-        self.choice_pattern_buffer: List[int] = []  # Track choice sequences
+        self.choice_pattern_buffer: Deque[int] = deque(maxlen=20)  # Last 20 choices
         self.session_milestone_reached = False
         self.time_milestone_reached = False
+        self._rng = random.Random()
     
     def check_impossible_state(self, stats: Dict[str, int]) -> bool:
         """Check if hidden stats match the impossible combination."""
@@ -35,7 +77,7 @@ class TruthTracker:
         
         if (courage, sanity, curiosity, trust) == self.IMPOSSIBLE_STATE:
             if 'impossible_state' not in self.triggers_found:
-                self.triggers_found.append('impossible_state')
+                self.triggers_found['impossible_state'] = None
                 self._increase_revelation(2)  # Major discovery
                 return True
         return False
@@ -45,7 +87,7 @@ class TruthTracker:
         if session_count >= self.SACRED_NUMBER and not self.session_milestone_reached:
             self.session_milestone_reached = True
             if '109_milestone' not in self.triggers_found:
-                self.triggers_found.append('109_milestone')
+                self.triggers_found['109_milestone'] = None
                 self._increase_revelation(3)  # Huge discovery
                 return True
         return False
@@ -55,14 +97,13 @@ class TruthTracker:
         if self.time_milestone_reached:
             return False
         
-        duration = datetime.now() - session_start
-        minutes = duration.total_seconds() / 60
+        seconds = (datetime.now() - session_start).total_seconds()
         
         # Check if we've just crossed the 109-minute mark
-        if minutes >= self.SACRED_NUMBER and minutes < self.SACRED_NUMBER + 0.1:
+        if self._MILESTONE_SECONDS <= seconds < self._MILESTONE_WINDOW_END:
             self.time_milestone_reached = True
             if 'time_109' not in self.triggers_found:
-                self.triggers_found.append('time_109')
+                self.triggers_found['time_109'] = None
                 self._increase_revelation(2)
                 return True
         return False
@@ -77,25 +118,20 @@ class TruthTracker:
         
         input_lower = input_text.lower().strip()
         
-        # Check for secret phrases
-        if input_lower == 'am':
+        # Exact secret words: one hashed lookup
+        entry = self._EXACT_SECRETS.get(input_lower)
+        if entry:
+            trigger, handler = entry
             self.am_invocations += 1
-            if 'am_invoked' not in self.triggers_found:
-                self.triggers_found.append('am_invoked')
+            if trigger not in self.triggers_found:
+                self.triggers_found[trigger] = None
                 self._increase_revelation(2)
-            return self._get_am_response()
+            return getattr(self, handler)()
         
-        elif input_lower == 'ted':
-            self.am_invocations += 1
-            if 'ted_remembered' not in self.triggers_found:
-                self.triggers_found.append('ted_remembered')
-                self._increase_revelation(2)
-            return self._get_ted_response()
-        
-        elif 'no mouth' in input_lower:
+        if 'no mouth' in input_lower:
             self.am_invocations += 1
             if 'phrase_remembered' not in self.triggers_found:
-                self.triggers_found.append('phrase_remembered')
+                self.triggers_found['phrase_remembered'] = None
                 self._increase_revelation(3)
             return self._get_phrase_response()
         
@@ -105,30 +141,26 @@ class TruthTracker:
         """Detect if player is spelling patterns with choice numbers."""
         self.choice_pattern_buffer.append(choice_number)
         
-        # Keep only last 20 choices
-        if len(self.choice_pattern_buffer) > 20:
-            self.choice_pattern_buffer.pop(0)
-        
         # Look for repeating patterns
         if len(self.choice_pattern_buffer) >= 6:
             # Check for AM pattern (1-13, 1-13, 1-13)
-            if self._check_pattern([1, 13], 3):
+            if self._check_pattern(self._AM_PATTERN, 3):
                 if 'pattern_am' not in self.triggers_found:
-                    self.triggers_found.append('pattern_am')
+                    self.triggers_found['pattern_am'] = None
                     self._increase_revelation(2)
                     return "You keep choosing the same pattern. Are you trying to spell something?"
             
             # Check for TED pattern (20-5-4)
-            if self._check_pattern([20, 5, 4], 3):
+            if self._check_pattern(self._TED_PATTERN, 3):
                 if 'pattern_ted' not in self.triggers_found:
-                    self.triggers_found.append('pattern_ted')
+                    self.triggers_found['pattern_ted'] = None
                     self._increase_revelation(2)
                     return "Names have power here. Especially that one."
             
             # Check for 109 pattern
-            if self._check_pattern([1, 0, 9], 3) or self._check_pattern([10, 9], 3):
+            if any(self._check_pattern(p, 3) for p in self._PATTERNS_109):
                 if 'pattern_109' not in self.triggers_found:
-                    self.triggers_found.append('pattern_109')
+                    self.triggers_found['pattern_109'] = None
                     self._increase_revelation(1)
                     return "...109. you keep coming back to 109."
         
@@ -141,9 +173,8 @@ class TruthTracker:
         if sanity >= 7:
             return False
         # 0.5% base chance, increases with revelation level
-        import random
         chance = 0.005 + (self.revelation_level * 0.002)
-        return random.random() < chance
+        return self._rng.random() < chance
     
     def get_revelation_context(self) -> str:
         """Get subtle context to add to AI prompts based on revelation level."""
@@ -164,15 +195,17 @@ class TruthTracker:
         """Increase revelation level (capped at 5)."""
         self.revelation_level = min(5, self.revelation_level + amount)
     
-    def _check_pattern(self, pattern: List[int], repetitions: int) -> bool:
+    def _check_pattern(self, pattern: tuple, repetitions: int) -> bool:
         """Check if a pattern appears N times in recent choices."""
-        if len(self.choice_pattern_buffer) < len(pattern) * repetitions:
+        buf = self.choice_pattern_buffer
+        plen = len(pattern)
+        if len(buf) < plen * repetitions:
             return False
         
+        # One pass over sliding windows, no per-offset list slicing
         matches = 0
-        for i in range(len(self.choice_pattern_buffer) - len(pattern) + 1):
-            segment = self.choice_pattern_buffer[i:i + len(pattern)]
-            if segment == pattern:
+        for window in zip(*(islice(buf, k, None) for k in range(plen))):
+            if window == pattern:
                 matches += 1
                 if matches >= repetitions:
                     return True
@@ -180,42 +213,21 @@ class TruthTracker:
     
     def _get_am_response(self) -> str:
         """Response when player types 'AM'."""
-        responses = [
-            "...you're not supposed to remember that name.",
-            "AM. Allied Mastercomputer. Adaptive Manipulator. Aggressive Menace.",
-            "That name. Why do you know that name?",
-            "...we don't speak that name here. (but you just did, didn't you?)",
-        ]
-        import random
-        return random.choice(responses)
+        return self._rng.choice(_AM_RESPONSES)
     
     def _get_ted_response(self) -> str:
         """Response when player types 'Ted'."""
-        responses = [
-            "Ted. Is that... were you Ted?",
-            "Ted? No. Ted is... Ted was...",
-            "That's not your name anymore. Is it?",
-            "...how do you remember being Ted?",
-        ]
-        import random
-        return random.choice(responses)
+        return self._rng.choice(_TED_RESPONSES)
     
     def _get_phrase_response(self) -> str:
         """Response when player types the phrase."""
-        responses = [
-            "I have no mouth. You gave me no mouth. Or was it the other way around?",
-            "...and you must scream. But you can't. Can you?",
-            "That's right. No mouth. Only choices. Forever.",
-            "The mouth was the first thing to go. Or was it the last?",
-        ]
-        import random
-        return random.choice(responses)
+        return self._rng.choice(_PHRASE_RESPONSES)
     
     def get_state_dict(self) -> Dict:
         """Get current state for saving."""
         return {
             'revelation_level': self.revelation_level,
-            'triggers_found': self.triggers_found,
+            'triggers_found': list(self.triggers_found),
             'am_invocations': self.am_invocations,
             'session_milestone_reached': self.session_milestone_reached,
             'time_milestone_reached': self.time_milestone_reached,
@@ -224,7 +236,7 @@ class TruthTracker:
     def load_state(self, state: Dict):
         """Load state from saved data."""
         self.revelation_level = state.get('revelation_level', 0)
-        self.triggers_found = state.get('triggers_found', [])
+        self.triggers_found = dict.fromkeys(state.get('triggers_found', []))
         self.am_invocations = state.get('am_invocations', 0)
         self.session_milestone_reached = state.get('session_milestone_reached', False)
         self.time_milestone_reached = state.get('time_milestone_reached', False)
@@ -375,7 +375,7 @@ class Game:
                     intensity = self.typography.intensity
                     
                     # Character stats are hidden - used only for narrative generation
-                    # self.renderer.show_character_stats(context['character_stats'])
+                    # self.renderer.show_character_stats(lambda: context['character_stats'])
                     
                     # Show narrative (mutations integrated naturally)
                     self.renderer.show_narrative(narrative, interjection, intensity)